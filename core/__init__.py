@@ -0,0 +1,44 @@
+"""
+Pakiet core - logika aplikacji TXM.
+
+Moduły pakietu są ładowane leniwie (PEP 562) przy pierwszym dostępie
+do atrybutu, dzięki czemu samo `import core` nie pociąga za sobą
+importu c4d ani modułów analizy tekstur.
+"""
+
+import importlib
+
+from .logger import Logger
+
+# Inicjalizacja loggera
+logger = Logger()
+
+# Nazwa publiczna -> (moduł, atrybut); None oznacza cały moduł
+_LAZY = {
+    "Controller": ("core.controller", "Controller"),
+    "files_worker": ("core.files_worker", None),
+    "files_analyzer": ("core.files_analyzer", None),
+    "models": ("core.models", None),
+}
+
+
+def __getattr__(name):
+    spec = _LAZY.get(name)
+    if spec is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # Jedyny punkt importu modułów pakietu - bez logowania na ścieżce sukcesu
+    try:
+        module = importlib.import_module(spec[0])
+    except ImportError as e:
+        logger.error("Import %s nieudany: %s", spec[0], e)
+        raise
+
+    obj = getattr(module, spec[1]) if spec[1] else module
+    # Zapamiętanie w przestrzeni nazw - kolejne odwołania omijają __getattr__
+    globals()[name] = obj
+    return obj
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY))
@@ -1,115 +1,142 @@
-import c4d
-import c4d.gui
-
-
-class UIConstants:
-    APP_NAME = "TXM"
-    APP_VERSION = "0.45"
-    WINDOW_TITLE = f"{APP_NAME} v{APP_VERSION}"
-
-    # ID elementów interfejsu
-    ID_SELECTION = 1
-    ID_TEXTURE_NAME = 2
-    ID_SZEROKOSC = 3
-    ID_WYSOKOSC = 4
-    ID_GLEBIA_BITOWA = 5
-    ID_PROFIL_KOLORU = 6
-    ID_ROZMIAR_MB = 7
-    ID_KANAL_ALPHA = 8
-    ID_FLAGA = 9
-    ID_DATA_UTWORZENIA = 10
-    ID_DATA_MODYFIKACJI = 11
-    ID_HASH = 12
-    ID_METADATA = 13
-    ID_FULL_PATH = 14
-    BTN_PROCESS_SELECTED = 15
-    STATUS_SELECTION_COUNT = 16
-    ID_FILE_SIZE = 17
-    STATUS_TOTAL_SIZE = 18
-    ID_CALCULATION = 19
-    STATUS_BAR_TEXT = 20  # Nowy identyfikator dla tekstu statusu
-
-    # Dodajemy identyfikatory dla nowych kolumn
-    ID_COLUMN_A5 = 10
-    ID_COLUMN_A6 = 11
-    ID_COLUMN_A7 = 12
-    ID_COLUMN_A8 = 13
-    ID_COLUMN_A9 = 14
-    ID_COLUMN_A10 = 15
-    ID_COLUMN_A11 = 16
-
-    ACTION_BUTTONS_GROUP = 100
-    BTN_IMPORT = 101
-    BTN_EXPORT = 102
-    BTN_REFRESH = 103
-    BTN_CLEAR = 104
-
-    # Nowy przycisk do obsługi dialogu postępu
-    PROGRESS_BTN = 105
-
-    TEXTURE_LOAD_GROUP = 200
-    TEXTURE_ACTIONS_GROUP = 201
-    TEXTURE_OPTIONS_GROUP = 202
-    BTN_LOAD_TEXTURES = 203
-    BTN_BROWSE = 204
-
-    SPACER_HEADER = 205
-    SPACER_FOOTER = 206
-    SPACER_LEFT_MARGIN = 207
-    SPACER_RIGHT_MARGIN = 208
-
-    TEXTURE_LIST_VIEW = 99
-
-    # Dodajemy stałe dla sortowania
-    SORT_ASCENDING = 0
-    SORT_DESCENDING = 1
-
-    # Flagi dla TreeView
-    TREEVIEW_FLAGS = {
-        "border": c4d.TREEVIEW_BORDER,
-        "header": c4d.TREEVIEW_HAS_HEADER,
-        "hide_lines": c4d.TREEVIEW_HIDE_LINES,
-        "move_column": c4d.TREEVIEW_MOVE_COLUMN,
-        "resize_header": c4d.TREEVIEW_RESIZE_HEADER,
-        "fixed_layout": c4d.TREEVIEW_FIXED_LAYOUT,
-        "alternate_bg": c4d.TREEVIEW_ALTERNATE_BG,
-        "cursor_keys": c4d.TREEVIEW_CURSORKEYS,
-        "no_enter_rename": c4d.TREEVIEW_NOENTERRENAME,
-    }
-
-    # Wymiary interfejsu
-    WINDOW_WIDTH = 900
-    WINDOW_HEIGHT = 450
-    SPACING_BUTTONS = 16
-    SPACING_BOTTOM = 27
-    MARGIN_GROUP = 5
-
-    # Dialog postępu
-    PROGRESS_DIALOG_WIDTH = 500
-    PROGRESS_DIALOG_HEIGHT = 150
-    PROGRESS_BAR_WIDTH = 300
-    PROGRESS_BAR_HEIGHT = 8
-
-    # Szerokości kolumn TreeView
-    COLUMN_SELECTION_WIDTH = 50
-    COLUMN_TEXTURE_NAME_WIDTH = 180
-    COLUMN_WIDTH_WIDTH = 80
-    COLUMN_HEIGHT_WIDTH = 80
-    COLUMN_BIT_DEPTH_WIDTH = 100
-    COLUMN_COLOR_PROFILE_WIDTH = 120
-    COLUMN_SIZE_MB_WIDTH = 100
-    COLUMN_ALPHA_CHANNEL_WIDTH = 90
-    COLUMN_FLAG_WIDTH = 120
-    COLUMN_CREATION_DATE_WIDTH = 150
-    COLUMN_MODIFICATION_DATE_WIDTH = 150
-    COLUMN_HASH_WIDTH = 330
-    COLUMN_FULL_PATH_WIDTH = 250
-
-    # Stałe dla statusu
-    STATUS_READY = "Ready"
-    STATUS_LOADING = "Loading..."
-    STATUS_ERROR = "Error"
-    STATUS_PROCESSING = "Processing..."
+import sys
+import types
+from typing import Final
+
+# Flagi TreeView budowane leniwie - moduł nie importuje c4d przy starcie
+_TREEVIEW_FLAGS = None
+
+APP_NAME: Final[str] = "TXM"
+APP_VERSION: Final[str] = "0.45"
+WINDOW_TITLE: Final[str] = sys.intern(f"{APP_NAME} v{APP_VERSION}")
+
+# ID elementów interfejsu
+ID_SELECTION: Final[int] = 1
+ID_TEXTURE_NAME: Final[int] = 2
+ID_SZEROKOSC: Final[int] = 3
+ID_WYSOKOSC: Final[int] = 4
+ID_GLEBIA_BITOWA: Final[int] = 5
+ID_PROFIL_KOLORU: Final[int] = 6
+ID_ROZMIAR_MB: Final[int] = 7
+ID_KANAL_ALPHA: Final[int] = 8
+ID_FLAGA: Final[int] = 9
+ID_DATA_UTWORZENIA: Final[int] = 10
+ID_DATA_MODYFIKACJI: Final[int] = 11
+ID_HASH: Final[int] = 12
+ID_METADATA: Final[int] = 13
+ID_FULL_PATH: Final[int] = 14
+BTN_PROCESS_SELECTED: Final[int] = 15
+STATUS_SELECTION_COUNT: Final[int] = 16
+ID_FILE_SIZE: Final[int] = 17
+STATUS_TOTAL_SIZE: Final[int] = 18
+ID_CALCULATION: Final[int] = 19
+STATUS_BAR_TEXT: Final[int] = 20  # Nowy identyfikator dla tekstu statusu
+
+# Dodajemy identyfikatory dla nowych kolumn
+# Uwaga: wartości pokrywają się z ID_DATA_UTWORZENIA..STATUS_SELECTION_COUNT
+ID_COLUMN_A5: Final[int] = 10
+ID_COLUMN_A6: Final[int] = 11
+ID_COLUMN_A7: Final[int] = 12
+ID_COLUMN_A8: Final[int] = 13
+ID_COLUMN_A9: Final[int] = 14
+ID_COLUMN_A10: Final[int] = 15
+ID_COLUMN_A11: Final[int] = 16
+
+ACTION_BUTTONS_GROUP: Final[int] = 100
+BTN_IMPORT: Final[int] = 101
+BTN_EXPORT: Final[int] = 102
+BTN_REFRESH: Final[int] = 103
+BTN_CLEAR: Final[int] = 104
+
+# Nowy przycisk do obsługi dialogu postępu
+PROGRESS_BTN: Final[int] = 105
+
+TEXTURE_LOAD_GROUP: Final[int] = 200
+TEXTURE_ACTIONS_GROUP: Final[int] = 201
+TEXTURE_OPTIONS_GROUP: Final[int] = 202
+BTN_LOAD_TEXTURES: Final[int] = 203
+BTN_BROWSE: Final[int] = 204
+
+SPACER_HEADER: Final[int] = 205
+SPACER_FOOTER: Final[int] = 206
+SPACER_LEFT_MARGIN: Final[int] = 207
+SPACER_RIGHT_MARGIN: Final[int] = 208
+
+TEXTURE_LIST_VIEW: Final[int] = 99
+
+# Dodajemy stałe dla sortowania
+SORT_ASCENDING: Final[int] = 0
+SORT_DESCENDING: Final[int] = 1
+
+# Wymiary interfejsu
+WINDOW_WIDTH: Final[int] = 900
+WINDOW_HEIGHT: Final[int] = 450
+SPACING_BUTTONS: Final[int] = 16
+SPACING_BOTTOM: Final[int] = 27
+MARGIN_GROUP: Final[int] = 5
+
+# Dialog postępu
+PROGRESS_DIALOG_WIDTH: Final[int] = 500
+PROGRESS_DIALOG_HEIGHT: Final[int] = 150
+PROGRESS_BAR_WIDTH: Final[int] = 300
+PROGRESS_BAR_HEIGHT: Final[int] = 8
+
+# Szerokości kolumn TreeView
+COLUMN_SELECTION_WIDTH: Final[int] = 50
+COLUMN_TEXTURE_NAME_WIDTH: Final[int] = 180
+COLUMN_WIDTH_WIDTH: Final[int] = 80
+COLUMN_HEIGHT_WIDTH: Final[int] = 80
+COLUMN_BIT_DEPTH_WIDTH: Final[int] = 100
+COLUMN_COLOR_PROFILE_WIDTH: Final[int] = 120
+COLUMN_SIZE_MB_WIDTH: Final[int] = 100
+COLUMN_ALPHA_CHANNEL_WIDTH: Final[int] = 90
+COLUMN_FLAG_WIDTH: Final[int] = 120
+COLUMN_CREATION_DATE_WIDTH: Final[int] = 150
+COLUMN_MODIFICATION_DATE_WIDTH: Final[int] = 150
+COLUMN_HASH_WIDTH: Final[int] = 330
+COLUMN_FULL_PATH_WIDTH: Final[int] = 250
+
+# Stałe dla statusu (internowane - używane jako klucze porównań)
+STATUS_READY: Final[str] = sys.intern("Ready")
+STATUS_LOADING: Final[str] = sys.intern("Loading...")
+STATUS_ERROR: Final[str] = sys.intern("Error")
+STATUS_PROCESSING: Final[str] = sys.intern("Processing...")
+# Status kontrolera oznaczający dostępny folder tekstur - porównywany przez `is`
+STATUS_FOUND_TEXTURES_FOLDER: Final[str] = sys.intern("Znaleziono folder tekstur")
+
+
+# Flagi dla TreeView
+def get_treeview_flags():
+    """Zwraca flagi TreeView, importując c4d dopiero przy pierwszym użyciu."""
+    global _TREEVIEW_FLAGS
+    if _TREEVIEW_FLAGS is None:
+        import c4d
+
+        # Mapowanie tylko do odczytu - chroni przed przypadkową modyfikacją
+        _TREEVIEW_FLAGS = types.MappingProxyType(
+            {
+                "border": c4d.TREEVIEW_BORDER,
+                "header": c4d.TREEVIEW_HAS_HEADER,
+                "hide_lines": c4d.TREEVIEW_HIDE_LINES,
+                "move_column": c4d.TREEVIEW_MOVE_COLUMN,
+                "resize_header": c4d.TREEVIEW_RESIZE_HEADER,
+                "fixed_layout": c4d.TREEVIEW_FIXED_LAYOUT,
+                "alternate_bg": c4d.TREEVIEW_ALTERNATE_BG,
+                "cursor_keys": c4d.TREEVIEW_CURSORKEYS,
+                "no_enter_rename": c4d.TREEVIEW_NOENTERRENAME,
+            }
+        )
+    return _TREEVIEW_FLAGS
+
+
+# Przestrzeń nazw dla wstecznej kompatybilności (UIConstants.ID_SELECTION itd.)
+UIConstants = types.SimpleNamespace(
+    **{
+        name: value
+        for name, value in globals().items()
+        if name.isupper() and not name.startswith("_")
+    },
+    get_treeview_flags=get_treeview_flags,
+)
 
 
 # Stałe globalne dla układu interfejsu
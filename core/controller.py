@@ -1,18 +1,93 @@
+import importlib
+import importlib.util
+import sys
+import time
+import types
+from enum import IntEnum
+from typing import Final
+
+import c4d
+
 from . import files_worker
+from .constants import STATUS_FOUND_TEXTURES_FOLDER
 from .files_analyzer import analyze_c4d_textures
 from .logger import Logger
 
 # Inicjalizacja loggera
 logger = Logger()
 
+# Komunikaty statusu zwracane przez kontroler (internowane, zwracane przez referencję)
+STATUS_NO_DOC: Final[str] = sys.intern("Brak aktywnego dokumentu C4D")
+STATUS_NO_TEX: Final[str] = sys.intern("Nie znaleziono folderu tekstur")
+STATUS_HAVE_TEX: Final[str] = STATUS_FOUND_TEXTURES_FOLDER
+
+
+class ProjState(IntEnum):
+    """Stan projektu C4D z punktu widzenia folderu tekstur."""
+
+    NO_DOC = 0
+    NO_TEX = 1
+    OK = 2
+
+
+# Tablica (tylko do odczytu) komunikatów statusu dla stanów projektu
+_STATUS_MSG = types.MappingProxyType(
+    {
+        ProjState.NO_DOC: STATUS_NO_DOC,
+        ProjState.NO_TEX: STATUS_NO_TEX,
+        ProjState.OK: STATUS_HAVE_TEX,
+    }
+)
+
+# Funkcja analizy ładowana leniwie przy pierwszym wywołaniu analyze_textures
+_analizuj_folder_tekstur = None
+
+# Współdzielona instancja kontrolera dla funkcji pomocniczych
+_controller_singleton = None
+
+
+def _get_controller():
+    """Zwraca współdzieloną instancję kontrolera, tworząc ją w razie potrzeby."""
+    global _controller_singleton
+    if _controller_singleton is None:
+        _controller_singleton = Controller()
+    return _controller_singleton
+
+
+# Wynik sprawdzenia folderu: ścieżka -> (czas sprawdzenia, czy istnieje)
+_dir_exists_cache = {}
+_DIR_EXISTS_TTL = 1.0  # sekundy
+
+
+def _dir_exists(path, ttl=_DIR_EXISTS_TTL):
+    """
+    Sprawdza folder przez files_worker.ensure_directory_exists,
+    zapamiętując wynik na `ttl` sekund.
+    """
+    now = time.monotonic()
+    cached = _dir_exists_cache.get(path)
+    if cached is not None and now - cached[0] < ttl:
+        return cached[1]
+
+    exists = files_worker.ensure_directory_exists(path)
+    _dir_exists_cache[path] = (now, exists)
+    return exists
+
+
+def invalidate():
+    """
+    Funkcja pomocnicza na poziomie modułu,
+    czyści zapamiętane ścieżki i wyniki sprawdzania folderów.
+    """
+    _get_controller().invalidate()
+
 
 def status():
     """
     Funkcja pomocnicza na poziomie modułu,
     sprawdza status folderu tex.
     """
-    controller = Controller()
-    return controller.status()
+    return _get_controller().status()
 
 
 def analyze_textures():
@@ -20,8 +95,7 @@ def analyze_textures():
     Funkcja pomocnicza na poziomie modułu,
     analizuje folder tekstur otwartego dokumentu.
     """
-    controller = Controller()
-    return controller.analyze_textures()
+    return _get_controller().analyze_textures()
 
 
 class Controller:
@@ -30,34 +104,75 @@ class Controller:
     na plikach w Cinema 4D.
     """
 
+    __slots__ = ("_paths_cache",)
+
     def __init__(self):
         """
         Inicjalizacja kontrolera.
         """
-        pass
+        # Ostatnio wyznaczone ścieżki projektu: (klucz dokumentu, (doc_path, tex_path))
+        self._paths_cache = None
 
-    def status(self):
+    def _project_paths(self):
         """
-        Sprawdza czy istnieje folder tex w katalogu
-        projektu Cinema 4D.
+        Zwraca ścieżki projektu, ponownie używając wyniku dla tego
+        samego dokumentu i tej samej ścieżki zapisu.
+
+        Zwraca:
+            tuple: (doc_path, texture_path) lub (None, None)
+        """
+        doc = c4d.documents.GetActiveDocument()
+        key = (id(doc), doc.GetDocumentPath() if doc is not None else None)
+
+        cached = self._paths_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        paths = files_worker.get_project_texture_path()
+        self._paths_cache = (key, paths)
+        return paths
+
+    def invalidate(self):
+        """
+        Czyści zapamiętane ścieżki projektu i wyniki sprawdzania folderów,
+        np. po kliknięciu przycisku Refresh.
+        """
+        self._paths_cache = None
+        _dir_exists_cache.clear()
+        files_worker.invalidate_path_caches()
+
+    def _classify(self):
+        """
+        Ustala stan projektu - wspólne drzewo decyzyjne
+        dla status() i analyze_textures().
 
         Zwraca:
-            str: Status sprawdzenia - "OK" jeśli folder istnieje,
-                 "NO_TEX_FOLDER" jeśli nie istnieje,
-                 "NO_DOCUMENT" jeśli nie ma aktywnego dokumentu
+            tuple: (ProjState, tex_path lub None)
         """
-        doc_path, tex_path = files_worker.get_project_texture_path()
+        doc_path, tex_path = self._project_paths()
 
         if doc_path is None:
-            logger.debug("Brak aktywnego dokumentu C4D")
-            return "Brak aktywnego dokumentu C4D"
+            return ProjState.NO_DOC, None
 
-        if files_worker.ensure_directory_exists(tex_path):
-            logger.debug("Znaleziono folder tekstur")
-            return "Znaleziono folder tekstur"
-        else:
-            logger.debug("Nie znaleziono folderu tekstur")
-            return "Nie znaleziono folderu tekstur"
+        if not _dir_exists(tex_path):
+            return ProjState.NO_TEX, tex_path
+
+        return ProjState.OK, tex_path
+
+    def status(self):
+        """
+        Sprawdza czy istnieje folder tex w katalogu
+        projektu Cinema 4D.
+
+        Zwraca:
+            str: Status sprawdzenia - STATUS_HAVE_TEX jeśli folder istnieje,
+                 STATUS_NO_TEX jeśli nie istnieje,
+                 STATUS_NO_DOC jeśli nie ma aktywnego dokumentu
+        """
+        state, _ = self._classify()
+        message = _STATUS_MSG[state]
+        logger.debug(message)
+        return message
 
     def analyze_textures(self):
         """
@@ -67,48 +182,47 @@ class Controller:
             str: Wynik analizy folderu tekstur
         """
         # Pobierz ścieżkę do folderu tekstur
-        doc_path, tex_path = files_worker.get_project_texture_path()
+        state, tex_path = self._classify()
 
-        if doc_path is None:
-            logger.debug("Brak aktywnego dokumentu C4D")
-            return "Brak aktywnego dokumentu C4D"
-
-        if not files_worker.ensure_directory_exists(tex_path):
-            logger.debug("Nie znaleziono folderu tekstur")
-            return "Nie znaleziono folderu tekstur"
+        if state is not ProjState.OK:
+            message = _STATUS_MSG[state]
+            logger.debug(message)
+            return message
 
         try:
-            # Importuj analizę tekstur
-            from .texture_runner import analizuj_folder_tekstur
+            # Importuj analizę tekstur tylko przy pierwszym wywołaniu
+            global _analizuj_folder_tekstur
+            if _analizuj_folder_tekstur is None:
+                # find_spec sprawdza dostępność modułu bez jego wykonywania
+                if importlib.util.find_spec(".texture_runner", __package__) is None:
+                    logger.error("Brak modułu texture_runner")
+                    return "Błąd analizy: brak modułu texture_runner"
 
-            # Uruchom analizę tekstur
-            logger.debug(f"Uruchamiam analizę folderu tekstur: {tex_path}")
-            wyniki = analizuj_folder_tekstur(tex_path, False)
-
-            if wyniki.get("sukces", False):
-                raport = wyniki.get("ścieżka_raportu", "")
-                logger.debug(f"Analiza zakończona pomyślnie, raport: {raport}")
-
-                # Wyprowadź informację o liczbie znalezionych plików
-                if "statystyki" in wyniki:
-                    liczba_tekstur = wyniki["statystyki"].get(
-                        "liczba_plików_graficznych", 0
-                    )
-                    return (
-                        f"Znaleziono {liczba_tekstur} plików tekstur. Raport zapisano."
-                    )
-                else:
-                    return "Analiza zakończona pomyślnie. Raport zapisano."
-            else:
-                logger.error(
-                    f"Błąd analizy: {wyniki.get('komunikat', 'Nieznany błąd')}"
-                )
-                return f"Błąd analizy: {wyniki.get('komunikat', 'Nieznany błąd')}"
+                runner = importlib.import_module(".texture_runner", __package__)
+                _analizuj_folder_tekstur = runner.analizuj_folder_tekstur
 
+            # Uruchom analizę tekstur
+            logger.debug("Uruchamiam analizę folderu tekstur: %s", tex_path)
+            wyniki = _analizuj_folder_tekstur(tex_path, False)
         except Exception as e:
-            logger.error(f"Błąd podczas analizy tekstur: {str(e)}")
-            return f"Błąd analizy: {str(e)}"
+            return _analysis_error(e)
+
+        if not wyniki.sukces:
+            logger.error("Błąd analizy: %s", wyniki.komunikat)
+            return f"Błąd analizy: {wyniki.komunikat}"
+
+        logger.debug(
+            "Analiza zakończona pomyślnie, raport: %s", wyniki.sciezka_raportu
+        )
+
+        # Wyprowadź informację o liczbie znalezionych plików
+        liczba_tekstur = wyniki.liczba_plikow_graficznych
+        if liczba_tekstur is not None:
+            return f"Znaleziono {liczba_tekstur} plików tekstur. Raport zapisano."
+        return "Analiza zakończona pomyślnie. Raport zapisano."
 
 
-if __name__ == "__main__":
-    logger.debug(status())
+def _analysis_error(e):
+    """Loguje wyjątek z analizy tekstur i zwraca komunikat dla użytkownika."""
+    logger.error("Błąd podczas analizy tekstur: %s", e)
+    return f"Błąd analizy: {e}"
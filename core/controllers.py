@@ -1,20 +1,183 @@
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any, Dict, List, Optional
 
 import c4d
 
-from core import files_worker
+from core import files_worker, texture_runner
 from core.constants import UIConstants
 from core.logger import Logger
 from core.models import TextureManager
 from core.utils import format_file_size, get_global_status, set_global_status
+from views.progress_dialog import ProgressDialog
 
 # Stała identyfikująca kolejkę wiadomości
 PLUGIN_ID_MESSAGE_QUEUE = 1000
 
+# Maksymalna liczba wątków przetwarzających tekstury
+MAX_PROCESSING_WORKERS = min(8, os.cpu_count() or 1)
+
+# Postęp przetwarzania przekazywany do wątku głównego co tyle zadań
+# lub co tyle sekund (co nastąpi wcześniej)
+PROGRESS_BATCH_SIZE = 64
+PROGRESS_BATCH_INTERVAL = 0.05
+
+# Ostatnio sformatowany rozmiar: (bajty, tekst) - przy przełączaniu UI
+# suma rozmiaru zaznaczonych zwykle się nie zmienia
+_last_size_fmt = (-1, "")
+
+
+def _format_size(size_in_bytes):
+    """format_file_size z pamięcią ostatniego wyniku."""
+    global _last_size_fmt
+    if _last_size_fmt[0] != size_in_bytes:
+        _last_size_fmt = (size_in_bytes, format_file_size(size_in_bytes))
+    return _last_size_fmt[1]
+
+
+# Szczegółowe logi DEBUG z metod odświeżania UI (domyślnie tylko podsumowania)
+_DEBUG_VERBOSE = False
+
+# Przyciski akcji włączane/wyłączane razem (łącznie z przyciskiem postępu)
+_ACTION_BTNS = (
+    UIConstants.BTN_IMPORT,
+    UIConstants.BTN_EXPORT,
+    UIConstants.BTN_REFRESH,
+    UIConstants.BTN_CLEAR,
+    UIConstants.PROGRESS_BTN,
+)
+
 logger = Logger()
 
 
+class AnalysisThread(c4d.threading.C4DThread):
+    """Wątek uruchamiający analizę folderu tekstur poza wątkiem UI."""
+
+    def __init__(self, directory, status_callback, on_done):
+        """
+        Args:
+            directory (str): Folder do przeanalizowania
+            status_callback: Callback postępu (etap, postęp, wiadomość)
+            on_done: Funkcja wywoływana w wątku głównym z wynikiem analizy
+        """
+        super().__init__()
+        self.directory = directory
+        self.status_callback = status_callback
+        self.on_done = on_done
+
+    def Main(self):
+        """Wykonuje analizę i przekazuje wynik do wątku głównego."""
+
+        def status_callback(etap, postep, wiadomosc):
+            # Żądanie zatrzymania wątku (End) przerywa analizę przez worker
+            if self.TestBreak():
+                return False
+            return self.status_callback(etap, postep, wiadomosc)
+
+        try:
+            wyniki = texture_runner.analizuj_folder_tekstur(
+                self.directory, False, status_callback
+            )
+        except Exception as e:
+            logger.error(f"Błąd w wątku analizy tekstur: {str(e)}")
+            wyniki = texture_runner.AnalyzeResult(
+                False, komunikat=f"Błąd w wątku analizy: {str(e)}"
+            )
+
+        c4d.utils.ExecuteOnMainThread(lambda: self.on_done(wyniki))
+
+
+def _process_texture(texture):
+    """
+    Przetwarza pojedynczą teksturę bez dostępu do sceny C4D
+    (wykonywane w wątku puli).
+
+    Returns:
+        tuple: (tekstura, rozmiar pliku na dysku lub None)
+    """
+    try:
+        return texture, os.stat(texture.texturePath).st_size
+    except OSError:
+        return texture, None
+
+
+# Jednowątkowa pula uruchamiająca kolejne operacje przetwarzania
+# (zachowuje kolejność operacji, wątek jest używany ponownie)
+_worker_pool = None
+
+
+def _get_worker_pool():
+    """Zwraca współdzieloną pulę operacji, tworząc ją przy pierwszym użyciu."""
+    global _worker_pool
+    if _worker_pool is None:
+        _worker_pool = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="txm-worker"
+        )
+    return _worker_pool
+
+
+def shutdown_worker_pool():
+    """Zatrzymuje pulę operacji i pulę wsadową files_worker (zamykanie pluginu)."""
+    global _worker_pool
+    if _worker_pool is not None:
+        _worker_pool.shutdown(wait=False, cancel_futures=True)
+        _worker_pool = None
+    files_worker.shutdown_batch_pool()
+
+
+def _run_processing(executor, textures, cancel_event, on_progress, on_done):
+    """
+    Rozdziela przetwarzanie tekstur na pulę wątków roboczych i zbiera
+    wyniki w kolejności ukończenia (wykonywane w puli operacji).
+
+    Args:
+        executor (ThreadPoolExecutor): Pula wykonująca _process_texture
+        textures (list): Tekstury do przetworzenia
+        cancel_event (threading.Event): Ustawione przerywa przetwarzanie
+        on_progress: Callback (liczba ukończonych, liczba wszystkich)
+        on_done: Funkcja wywoływana w wątku głównym z listą wyników
+    """
+    total = len(textures)
+    results = []
+    futures = []
+    done = 0
+    pending = 0
+    last_push = time.monotonic()
+    try:
+        # Wewnątrz try - błąd submit (np. pula zamknięta) też kończy się on_done
+        futures = [executor.submit(_process_texture, t) for t in textures]
+        for future in as_completed(futures):
+            if cancel_event.is_set():
+                logger.debug("Operacja anulowana przez użytkownika")
+                break
+            results.append(future.result())
+            done += 1
+            pending += 1
+
+            # Postęp zbiorczo - jedno przekazanie do UI na paczkę zadań
+            now = time.monotonic()
+            if (
+                pending >= PROGRESS_BATCH_SIZE
+                or now - last_push > PROGRESS_BATCH_INTERVAL
+            ):
+                on_progress(done, total)
+                pending = 0
+                last_push = now
+
+        if pending and not cancel_event.is_set():
+            on_progress(done, total)
+    except Exception as e:
+        logger.error(f"Błąd w wątku przetwarzania: {str(e)}")
+        cancel_event.set()
+    finally:
+        # Zadania jeszcze nierozpoczęte nie są potrzebne po anulowaniu
+        for future in futures:
+            future.cancel()
+
+    c4d.utils.ExecuteOnMainThread(lambda: on_done(results))
+
+
 class TextureController:
     """Kontroler zarządzający logiką przetwarzania tekstur."""
 
@@ -23,30 +186,92 @@ class TextureController:
         logger.debug("Inicjalizacja TextureController")
         self.texture_manager = texture_manager
         self.dialog = dialog
+        self._analysis_thread = None
+        self._processing_future = None
+        self._processing_cancel = None
+        self._executor = None
+        # Ostatnio zapisane wartości kontrolek: (rodzaj, id) -> wartość
+        self._ui_cache = {}
+        # Ostatnio wyświetlone (zaznaczone, wszystkie, rozmiar)
+        self._last_sel_tuple = None
         logger.debug(
             "TextureController zainicjalizowany z menedżerem tekstur i dialogiem"
         )
 
+    def _set_enabled(self, gadget_id, enabled) -> None:
+        """Włącza/wyłącza kontrolkę tylko gdy stan różni się od poprzedniego."""
+        key = ("enable", gadget_id)
+        if self._ui_cache.get(key) is not enabled:
+            self._ui_cache[key] = enabled
+            self.dialog.Enable(gadget_id, enabled)
+
+    def _apply_enable(self, pairs) -> None:
+        """Stosuje pary (id, stan), wywołując Enable tylko dla zmienionych."""
+        for gadget_id, enabled in pairs:
+            self._set_enabled(gadget_id, enabled)
+
+    def _set_string(self, gadget_id, text) -> None:
+        """Ustawia tekst kontrolki tylko gdy różni się od poprzedniego."""
+        key = ("string", gadget_id)
+        if self._ui_cache.get(key) != text:
+            self._ui_cache[key] = text
+            self.dialog.SetString(gadget_id, text)
+
+    def invalidate_ui_cache(self) -> None:
+        """Czyści zapamiętany stan kontrolek - kolejne zapisy trafią do dialogu."""
+        self._ui_cache.clear()
+        self._last_sel_tuple = None
+
+    def set_status_text(self, text) -> None:
+        """
+        Ustawia tekst statusu. Nadpisuje informację o zaznaczeniu,
+        więc kolejne update_selection_info musi ją ponownie zapisać.
+        """
+        self._last_sel_tuple = None
+        self.dialog.SetString(UIConstants.STATUS_TOTAL_SIZE, text)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Zwraca pulę wątków kontrolera, tworząc ją przy pierwszym użyciu."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=MAX_PROCESSING_WORKERS, thread_name_prefix="txm"
+            )
+        return self._executor
+
+    def shutdown(self) -> None:
+        """Zatrzymuje wątki kontrolera i pulę, anulując zadania oczekujące."""
+        if self._processing_cancel is not None:
+            self._processing_cancel.set()
+
+        # End(False) ustawia flagę TestBreak bez czekania na wątek
+        if self._analysis_thread is not None and self._analysis_thread.IsRunning():
+            self._analysis_thread.End(False)
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
     def setup_initial_button_state(self, status: str) -> bool:
         """Ustawia początkowy stan przycisków."""
         try:
-            logger.debug("Konfiguracja początkowego stanu przycisków")
+            # Layout został zbudowany od nowa - zapamiętany stan jest nieaktualny
+            self.invalidate_ui_cache()
             # Wszystkie przyciski domyślnie nieaktywne
             self.dialog.Enable(UIConstants.BTN_BROWSE, False)
-            self.dialog.Enable(UIConstants.BTN_PROCESS_SELECTED, False)
-            self.dialog.Enable(
-                UIConstants.PROGRESS_BTN, False
-            )  # Upewniamy się, że przycisk postępu jest wyłączony
+            self._set_enabled(UIConstants.BTN_PROCESS_SELECTED, False)
+            # Przyciski akcji, łącznie z przyciskiem postępu
             self.set_action_buttons_state(False)
 
             # Używamy przekazanego statusu
-            if status == "Znaleziono folder tekstur":
+            browse_enabled = status is UIConstants.STATUS_FOUND_TEXTURES_FOLDER
+            if browse_enabled:
                 self.dialog.Enable(UIConstants.BTN_BROWSE, True)
-                logger.debug("Aktywowano przycisk Load Textures")
-                logger.debug("Sprawdzanie statusu przed aktywacją przycisku")
-                logger.debug(f"Status: {status}")
 
-            logger.debug("Przyciski zostały ustawione w stan początkowy")
+            logger.debug(
+                "Początkowy stan przycisków: status=%s, load_textures=%s",
+                status,
+                browse_enabled,
+            )
             return True
         except Exception as e:
             logger.error(
@@ -54,27 +279,34 @@ class TextureController:
             )
             return False
 
-    def update_ui_state(self) -> bool:
-        """Aktualizuje stan przycisków w oparciu o bieżący stan aplikacji."""
-        try:
-            has_textures = self.texture_manager.get_texture_count() > 0
-            has_selected = self.texture_manager.count_selected() > 0
+    def update_ui_state(self, snap=None) -> bool:
+        """
+        Aktualizuje stan przycisków w oparciu o bieżący stan aplikacji.
 
-            logger.debug(
-                f"Stan aplikacji: tekstury={has_textures}, zaznaczone={has_selected}"
+        Args:
+            snap (SelectionSnapshot, optional): Gotowy stan zaznaczenia
+        """
+        try:
+            if snap is None:
+                snap = self.texture_manager.snapshot()
+            has_textures = snap.total > 0
+            has_selected = snap.selected > 0
+
+            self._apply_enable(
+                (
+                    (UIConstants.BTN_PROCESS_SELECTED, has_textures),
+                    (UIConstants.BTN_IMPORT, True),  # Import zawsze dostępny
+                    (UIConstants.BTN_EXPORT, has_selected),
+                    (UIConstants.BTN_REFRESH, has_textures),
+                    (UIConstants.BTN_CLEAR, has_textures),
+                    (UIConstants.PROGRESS_BTN, has_selected),
+                )
             )
 
-            self.dialog.Enable(UIConstants.BTN_PROCESS_SELECTED, has_textures)
-            self.dialog.Enable(UIConstants.BTN_IMPORT, True)  # Import zawsze dostępny
-            self.dialog.Enable(UIConstants.BTN_EXPORT, has_selected)
-            self.dialog.Enable(UIConstants.BTN_REFRESH, has_textures)
-            self.dialog.Enable(UIConstants.BTN_CLEAR, has_textures)
-            self.dialog.Enable(UIConstants.PROGRESS_BTN, has_selected)
-
-            # Dodajemy dodatkowe logowanie
-            logger.debug(f"Przycisk postępu aktywny: {has_selected}")
-
-            logger.debug("Stan przycisków został zaktualizowany")
+            if _DEBUG_VERBOSE:
+                logger.debug(
+                    "Stan UI: tekstury=%s, zaznaczone=%s", has_textures, has_selected
+                )
             return True
         except Exception as e:
             logger.error(f"Błąd podczas aktualizacji stanu UI: {str(e)}")
@@ -83,16 +315,14 @@ class TextureController:
     def toggle_selection(self) -> bool:
         """Przełącza zaznaczenie wszystkich tekstur."""
         try:
-            logger.debug("Przełączanie stanu zaznaczenia wszystkich tekstur")
-            if self.texture_manager.are_all_selected():
-                logger.debug("Odznaczanie wszystkich tekstur")
-                self.texture_manager.deselect_all()
-            else:
-                logger.debug("Zaznaczanie wszystkich tekstur")
+            select = not self.texture_manager.are_all_selected()
+            if select:
                 self.texture_manager.select_all()
+            else:
+                self.texture_manager.deselect_all()
 
+            logger.debug("Przełączono zaznaczenie wszystkich tekstur: %s", select)
             self.handle_state_change("selection_changed")
-            logger.debug("Zakończono przełączanie zaznaczenia")
             return True
         except Exception as e:
             logger.error(f"Błąd podczas przełączania zaznaczenia: {str(e)}")
@@ -113,6 +343,13 @@ class TextureController:
     def load_textures_from_directory(self, directory: str = None) -> bool:
         """Ładuje tekstury z wybranego katalogu i wykonuje analizę."""
         try:
+            if (
+                self._analysis_thread is not None
+                and self._analysis_thread.IsRunning()
+            ):
+                logger.warning("Analiza tekstur jest już w toku")
+                return False
+
             # Jeśli nie podano katalogu, użyj folderu tekstur aktywnego dokumentu C4D
             if not directory:
                 doc_path, tex_path = files_worker.get_project_texture_path()
@@ -120,17 +357,14 @@ class TextureController:
                     logger.warning(
                         "Brak aktywnego dokumentu C4D lub brak folderu tekstur"
                     )
-                    self.dialog.SetString(
-                        UIConstants.STATUS_TOTAL_SIZE,
-                        "Status: Brak aktywnego dokumentu C4D lub folderu tekstur",
+                    self.set_status_text(
+                        "Status: Brak aktywnego dokumentu C4D lub folderu tekstur"
                     )
                     return False
                 directory = tex_path
 
-            logger.debug(f"Rozpoczęcie analizy tekstur z katalogu: {directory}")
-            self.dialog.SetString(
-                UIConstants.STATUS_TOTAL_SIZE, "Status: Analizowanie tekstur..."
-            )
+            logger.debug("Rozpoczęcie analizy tekstur z katalogu: %s", directory)
+            self.set_status_text("Status: Analizowanie tekstur...")
 
             # Inicjalizacja kontrolera postępu
             progress_controller = ProgressController()
@@ -145,71 +379,93 @@ class TextureController:
                 async_mode=True,  # Używamy trybu asynchronicznego
             )
 
-            # Funkcja callback dla aktualizacji postępu
+            # Funkcja callback dla aktualizacji postępu - wywoływana w wątku
+            # analizy, więc aktualizację dialogu przekazujemy do wątku głównego
             def status_callback(etap, postęp, wiadomość):
                 if progress_controller.is_canceled(progress_dialog):
                     return False
-                progress_controller.update_progress(
-                    progress_dialog, postęp, f"{etap}: {wiadomość}"
-                )
-                return True
 
-            # Użyj funkcji analizy tekstur
-            import core.texture_runner
+                message = f"{etap}: {wiadomość}"
 
-            wyniki = core.texture_runner.analizuj_folder_tekstur(
-                directory, False, status_callback
-            )
+                def update_ui():
+                    progress_controller.update_progress(
+                        progress_dialog, postęp, message
+                    )
 
-            if not wyniki.get("sukces", False):
-                logger.error(
-                    f"Błąd analizy: {wyniki.get('komunikat', 'Nieznany błąd')}"
-                )
-                self.dialog.SetString(
-                    UIConstants.STATUS_TOTAL_SIZE,
-                    f"Status: Błąd analizy: {wyniki.get('komunikat', 'Nieznany błąd')}",
-                )
+                c4d.utils.ExecuteOnMainThread(update_ui)
+                return True
+
+            def on_done(wyniki):
                 progress_controller.close_progress_dialog(progress_dialog)
+                self._analysis_thread = None
+                self._on_analysis_done(wyniki)
+
+            # Uruchom analizę tekstur w osobnym wątku, aby nie blokować UI
+            self._analysis_thread = AnalysisThread(directory, status_callback, on_done)
+            self._analysis_thread.Start()
+
+            return True
+        except Exception as e:
+            logger.error(f"Błąd podczas analizy i wczytywania tekstur: {str(e)}")
+            self.set_status_text(f"Status: Błąd: {str(e)}")
+            return False
+
+    def _on_analysis_done(self, wyniki) -> bool:
+        """Ładuje wyniki analizy do menedżera tekstur (wątek główny)."""
+        try:
+            if not wyniki.sukces:
+                logger.error(f"Błąd analizy: {wyniki.komunikat}")
+                self.set_status_text(f"Status: Błąd analizy: {wyniki.komunikat}")
                 return False
 
             # Załaduj wyniki do menedżera tekstur
-            self.texture_manager.load_textures_from_analysis(wyniki)
+            self.texture_manager.load_textures_from_analysis(wyniki.dane)
 
             # Aktualizuj UI
             self.handle_state_change("textures_loaded")
 
             # Aktualizuj status
             liczba_tekstur = self.texture_manager.get_texture_count()
-            self.dialog.SetString(
-                UIConstants.STATUS_TOTAL_SIZE,
-                f"Status: Załadowano {liczba_tekstur} tekstur z analizy",
+            self.set_status_text(
+                f"Status: Załadowano {liczba_tekstur} tekstur z analizy"
             )
 
-            # Zamknięcie dialogu postępu
-            progress_controller.close_progress_dialog(progress_dialog)
-
             logger.debug("Zakończono analizę i wczytywanie tekstur")
             return True
         except Exception as e:
-            logger.error(f"Błąd podczas analizy i wczytywania tekstur: {str(e)}")
-            self.dialog.SetString(
-                UIConstants.STATUS_TOTAL_SIZE, f"Status: Błąd: {str(e)}"
-            )
+            logger.error(f"Błąd podczas wczytywania wyników analizy: {str(e)}")
+            self.set_status_text(f"Status: Błąd: {str(e)}")
             return False
 
-    def update_selection_info(self) -> bool:
-        """Aktualizuje informacje o zaznaczeniu w interfejsie."""
+    def update_selection_info(self, snap=None) -> bool:
+        """
+        Aktualizuje informacje o zaznaczeniu w interfejsie.
+
+        Args:
+            snap (SelectionSnapshot, optional): Gotowy stan zaznaczenia
+        """
         try:
-            selected = self.texture_manager.count_selected()
-            total = self.texture_manager.get_texture_count()
-            size_sum = self.texture_manager.calculate_selected_size()
+            if snap is None:
+                snap = self.texture_manager.snapshot()
+            total, selected, size_sum, all_selected = snap
 
-            logger.debug(
-                f"Statystyki: zaznaczone={selected}, całkowite={total}, rozmiar={format_file_size(size_sum)}"
-            )
+            # Bez zmian od ostatniego wywołania - dialog już to wyświetla
+            key = (selected, total, size_sum)
+            if key == self._last_sel_tuple:
+                return True
+            self._last_sel_tuple = key
+
+            # Formatowanie rozmiaru tylko gdy komunikat DEBUG zostanie wypisany
+            if _DEBUG_VERBOSE and logger.is_debug_enabled():
+                logger.debug(
+                    "Statystyki: zaznaczone=%d, całkowite=%d, rozmiar=%s",
+                    selected,
+                    total,
+                    _format_size(size_sum),
+                )
 
             # Aktualizujemy licznik zaznaczonych elementów
-            self.dialog.SetString(
+            self._set_string(
                 UIConstants.STATUS_SELECTION_COUNT, f"Selected: {selected} / {total}"
             )
 
@@ -217,7 +473,7 @@ class TextureController:
             if selected > 0:
                 self.dialog.SetString(
                     UIConstants.STATUS_TOTAL_SIZE,
-                    f"Status: Zaznaczono {selected} z {total} - Rozmiar: {format_file_size(size_sum)}",
+                    f"Status: Zaznaczono {selected} z {total} - Rozmiar: {_format_size(size_sum)}",
                 )
             else:
                 # Jeśli nic nie jest zaznaczone, ale są pliki, informujemy o tym
@@ -232,14 +488,13 @@ class TextureController:
                         UIConstants.STATUS_TOTAL_SIZE, "Status: Ready"
                     )
 
-            all_selected = selected == total and total > 0
-            self.dialog.SetString(
+            self._set_string(
                 UIConstants.BTN_PROCESS_SELECTED,
                 "Odznacz wszystkie" if all_selected else "Zaznacz wszystkie",
             )
 
             # Aktualizujemy stan przycisku postępu
-            self.dialog.Enable(UIConstants.PROGRESS_BTN, selected > 0)
+            self._set_enabled(UIConstants.PROGRESS_BTN, selected > 0)
 
             return True
         except Exception as e:
@@ -251,7 +506,11 @@ class TextureController:
     def set_button_state(self, button_id, enabled) -> bool:
         """Ustawia stan pojedynczego przycisku."""
         try:
-            logger.debug(f"Ustawianie stanu przycisku {button_id} na {enabled}")
+            if _DEBUG_VERBOSE:
+                logger.debug("Ustawianie stanu przycisku %s na %s", button_id, enabled)
+            # Zapis z pominięciem pamięci stanu - przycisk może być też
+            # ustawiany spoza kontrolera
+            self._ui_cache.pop(("enable", button_id), None)
             self.dialog.Enable(button_id, enabled)
             return True
         except Exception as e:
@@ -261,15 +520,9 @@ class TextureController:
     def set_action_buttons_state(self, enabled) -> bool:
         """Ustawia stan wszystkich przycisków akcji."""
         try:
-            logger.debug(f"Ustawianie stanu wszystkich przycisków akcji na: {enabled}")
-            self.dialog.Enable(UIConstants.BTN_IMPORT, enabled)
-            self.dialog.Enable(UIConstants.BTN_EXPORT, enabled)
-            self.dialog.Enable(UIConstants.BTN_REFRESH, enabled)
-            self.dialog.Enable(UIConstants.BTN_CLEAR, enabled)
-            self.dialog.Enable(
-                UIConstants.PROGRESS_BTN, enabled
-            )  # Dodano przycisk postępu
-            logger.debug("Zaktualizowano stan wszystkich przycisków akcji")
+            self._apply_enable((button_id, enabled) for button_id in _ACTION_BTNS)
+            if _DEBUG_VERBOSE:
+                logger.debug("Stan wszystkich przycisków akcji: %s", enabled)
             return True
         except Exception as e:
             logger.error(f"Błąd podczas ustawiania stanu przycisków akcji: {str(e)}")
@@ -278,31 +531,32 @@ class TextureController:
     def handle_state_change(self, change_type, data=None) -> bool:
         """Obsługuje zmiany stanu aplikacji."""
         try:
-            logger.debug(f"Obsługa zmiany stanu aplikacji: {change_type}")
-
             self.dialog.treeview.Refresh()
-            self.update_selection_info()
-            self.update_ui_state()
+            snap = self.texture_manager.snapshot()
+            self.update_selection_info(snap)
+            self.update_ui_state(snap)
 
             if change_type == "textures_loaded":
-                texture_count = self.texture_manager.get_texture_count()
-                selected_count = self.texture_manager.count_selected()
-                logger.debug(f"Załadowano {texture_count} tekstur")
+                texture_count = snap.total
+                selected_count = snap.selected
                 if selected_count > 0:
-                    self.dialog.SetString(
-                        UIConstants.STATUS_TOTAL_SIZE,
-                        f"Status: Zaznaczono {selected_count} z {texture_count} tekstur",
+                    self.set_status_text(
+                        f"Status: Zaznaczono {selected_count} z {texture_count} tekstur"
                     )
                 else:
-                    self.dialog.SetString(
-                        UIConstants.STATUS_TOTAL_SIZE,
-                        f"Status: Wczytano {texture_count} tekstur (brak zaznaczonych)",
+                    self.set_status_text(
+                        f"Status: Wczytano {texture_count} tekstur (brak zaznaczonych)"
                     )
             elif change_type == "textures_cleared":
-                logger.debug("Wyczyszczono wszystkie tekstury")
-                self.dialog.SetString(UIConstants.STATUS_TOTAL_SIZE, "Status: Ready")
+                self.set_status_text("Status: Ready")
 
-            logger.debug("Zakończono obsługę zmiany stanu")
+            # Jedno podsumowanie zamiast logów z każdego kroku
+            logger.debug(
+                "Zmiana stanu: typ=%s, tekstury=%d, zaznaczone=%d",
+                change_type,
+                snap.total,
+                snap.selected,
+            )
             return True
         except Exception as e:
             logger.error(f"Błąd podczas obsługi zmiany stanu: {str(e)}")
@@ -314,11 +568,20 @@ class TextureController:
         """
         try:
             logger.debug("Rozpoczynam operację z paskiem postępu")
+            if (
+                self._processing_future is not None
+                and not self._processing_future.done()
+            ):
+                logger.warning("Przetwarzanie tekstur jest już w toku")
+                return False
+
             texture_count = self.texture_manager.count_selected()
-            logger.debug(f"Liczba zaznaczonych tekstur: {texture_count}")
+            logger.debug("Liczba zaznaczonych tekstur: %d", texture_count)
 
             if texture_count == 0:
-                c4d.gui.MessageDialog("Nie wybrano żadnych tekstur do przetworzenia.")
+                from c4d import gui
+
+                gui.MessageDialog("Nie wybrano żadnych tekstur do przetworzenia.")
                 return False
 
             # Inicjalizacja kontrolera postępu
@@ -337,66 +600,62 @@ class TextureController:
                 logger.error("Nie udało się utworzyć dialogu postępu")
                 return False
 
-            # Dodajemy flagę anulowania operacji
-            processing_cancelled = [False]
-
-            # Użycie c4d.threading zamiast standardowego threading
-            # Uruchom przetwarzanie w osobnym wątku
-            def processing_thread():
-                try:
-                    for i in range(texture_count):
-                        # Sprawdź, czy operacja została anulowana
-                        if (
-                            progress_controller.is_canceled(progress_dialog)
-                            or processing_cancelled[0]
+            # Jedna flaga anulowania: przycisk Anuluj dialogu, błąd aktualizacji
+            # dialogu i wątek roboczy ustawiają/odczytują to samo zdarzenie
+            cancel_event = progress_dialog.cancel_event
+
+            def on_progress(done, total):
+                progress = done / total
+                message = f"Przetwarzanie tekstury {done} z {total}..."
+
+                # Bezpieczna aktualizacja dialogu w wątku głównym
+                def update_ui():
+                    if not cancel_event.is_set():
+                        if not progress_controller.update_progress(
+                            progress_dialog, progress, message
                         ):
-                            logger.debug("Operacja anulowana przez użytkownika")
-                            return
-
-                        # Bezpieczna aktualizacja dialogu poprzez wywołanie asynchroniczne
-                        progress = (i + 1) / texture_count
-                        message = f"Przetwarzanie tekstury {i + 1} z {texture_count}..."
-
-                        # Użycie c4d.utils.ExecuteOnMainThread zamiast CallAsyncFunction
-                        def update_ui():
-                            if not processing_cancelled[0]:
-                                if not progress_controller.update_progress(
-                                    progress_dialog, progress, message
-                                ):
-                                    processing_cancelled[0] = True
-
-                        c4d.utils.ExecuteOnMainThread(update_ui)
-
-                        # Symulacja operacji
-                        c4d.threading.GeThreadLock()
-                        time.sleep(0.2)
-                        c4d.threading.GeThreadUnlock()
-
-                    # Operacja zakończona - bezpieczna aktualizacja UI
-                    def complete_operation():
-                        if not processing_cancelled[0]:
-                            progress_controller.update_progress(
-                                progress_dialog,
-                                1.0,
-                                f"Zakończono przetwarzanie {texture_count} tekstur.",
-                            )
-
-                            # Opóźnione zamknięcie dialogu
-                            def close_dialog():
-                                progress_controller.close_progress_dialog(
-                                    progress_dialog
-                                )
-
-                            c4d.utils.ExecuteOnMainThread(close_dialog)
-
-                    c4d.utils.ExecuteOnMainThread(complete_operation)
-                except Exception as e:
-                    logger.error(f"Błąd w wątku przetwarzania: {str(e)}")
-                    processing_cancelled[0] = True
-
-            # Użycie c4d.threading.C4DThread zamiast standardowego wątku
-            thread = c4d.threading.C4DThread(processing_thread)
-            thread.Start()
+                            cancel_event.set()
+
+                c4d.utils.ExecuteOnMainThread(update_ui)
+
+            def on_done(results):
+                self._processing_future = None
+                self._processing_cancel = None
+                if cancel_event.is_set():
+                    progress_controller.close_progress_dialog(progress_dialog)
+                    return
+
+                # Zapis wyników do modelu tylko w wątku głównym; sformatowane
+                # wartości kolumn (TextureListView) są nieaktualne
+                for texture, size in results:
+                    if size is not None:
+                        texture.filesize = size
+                        cache = getattr(texture, "_attr_cache", None)
+                        if cache:
+                            cache.clear()
+
+                # Odświeżenie drzewa i informacji o zaznaczeniu po zmianie modelu
+                self.handle_state_change("textures_processed")
+
+                progress_controller.update_progress(
+                    progress_dialog,
+                    1.0,
+                    f"Zakończono przetwarzanie {texture_count} tekstur.",
+                )
+                progress_controller.close_progress_dialog(progress_dialog)
+
+            selected = [
+                t for t in self.texture_manager.get_textures() if t.is_selected
+            ]
+            self._processing_cancel = cancel_event
+            self._processing_future = _get_worker_pool().submit(
+                _run_processing,
+                self._get_executor(),
+                selected,
+                cancel_event,
+                on_progress,
+                on_done,
+            )
 
             return True
         except Exception as e:
@@ -414,24 +673,26 @@ class StatusManager:
         self._selection_count = 0
         self._total_count = 0
         self._total_size = 0
+        # Ostatnio wyświetlone (zaznaczone, wszystkie, rozmiar)
+        self._last_sel_tuple = None
         self._current_status = initial_status
         self._update_status_display(initial_status)
         logger.debug("StatusManager zainicjalizowany")
 
     def _update_status_display(self, status):
         """Aktualizuje wyświetlany status w interfejsie."""
+        # Status nadpisuje informację o zaznaczeniu
+        self._last_sel_tuple = None
         self.dialog.SetString(UIConstants.STATUS_TOTAL_SIZE, f"Status: {status}")
 
     def set_status(self, status):
         """Ustawia nowy status i aktualizuje interfejs."""
-        logger.debug(f"Status: {status}")
+        logger.debug("Status: %s", status)
         set_global_status(status)
         self._update_status_display(status)
 
-        # Aktywuj przycisk Load Textures jeśli status to "Znaleziono folder tekstur"
-        logger.debug("Sprawdzanie warunku aktywacji przycisku Load Textures")
-        logger.debug(f"Status: {status}")
-        if status == "Znaleziono folder tekstur":
+        # Aktywuj przycisk Load Textures jeśli folder tekstur jest dostępny
+        if status is UIConstants.STATUS_FOUND_TEXTURES_FOLDER:
             logger.debug("Aktywacja przycisku Load Textures - warunek spełniony")
             self.dialog.Enable(UIConstants.BTN_BROWSE, True)
         else:
@@ -441,9 +702,18 @@ class StatusManager:
 
     def update_selection_info(self, selected, total, size_sum):
         """Aktualizuje informacje o zaznaczeniu."""
-        logger.debug(
-            f"Aktualizacja informacji o zaznaczeniu: {selected}/{total} ({format_file_size(size_sum)})"
-        )
+        key = (selected, total, size_sum)
+        if key == self._last_sel_tuple:
+            return
+        self._last_sel_tuple = key
+
+        if logger.is_debug_enabled():
+            logger.debug(
+                "Aktualizacja informacji o zaznaczeniu: %d/%d (%s)",
+                selected,
+                total,
+                _format_size(size_sum),
+            )
         self._selection_count = selected
         self._total_count = total
         self._total_size = size_sum
@@ -457,7 +727,7 @@ class StatusManager:
         if selected > 0:
             self.dialog.SetString(
                 UIConstants.STATUS_TOTAL_SIZE,
-                f"Status: Zaznaczono {selected} z {total} - Rozmiar: {format_file_size(size_sum)}",
+                f"Status: Zaznaczono {selected} z {total} - Rozmiar: {_format_size(size_sum)}",
             )
         else:
             # Jeśli nic nie jest zaznaczone, ale są pliki, informujemy o tym
@@ -506,6 +776,9 @@ class ProgressController:
     def __init__(self, dialog=None):
         """Inicjalizacja kontrolera dialogu postępu."""
         self.dialog = dialog
+        # Ograniczenie częstotliwości odświeżania dialogu postępu (max 30 Hz)
+        self._last_update = 0.0
+        self._min_interval = 1.0 / 30
         logger.debug("Zainicjalizowano ProgressController")
 
     def show_progress_dialog(
@@ -530,8 +803,6 @@ class ProgressController:
             ProgressDialog: Instancja dialogu postępu lub None w przypadku błędu
         """
         try:
-            from views.progress_dialog import ProgressDialog
-
             progress_dialog = ProgressDialog(
                 title=title,
                 message=message,
@@ -551,7 +822,7 @@ class ProgressController:
             )
 
             if result:
-                logger.debug(f"Otwarto dialog postępu: {title}")
+                logger.debug("Otwarto dialog postępu: %s", title)
                 progress_dialog.IsOpened = True  # Dodajemy atrybut IsOpened
                 c4d.EventAdd()  # Upewniamy się, że C4D przetworzy zdarzenia
                 return progress_dialog
@@ -587,6 +858,13 @@ class ProgressController:
                 )
                 return False
 
+            # Pomijamy aktualizacje częstsze niż _min_interval - końcowa
+            # aktualizacja (progress >= 1.0) jest zawsze wykonywana
+            now = time.monotonic()
+            if progress < 1.0 and now - self._last_update < self._min_interval:
+                return True
+            self._last_update = now
+
             # Aktualizacja wartości postępu
             dialog.SetProgress(progress)
 
@@ -594,8 +872,8 @@ class ProgressController:
             if message is not None:
                 dialog.SetMessage(message)
 
-            # Aktualizacja interfejsu - uproszczona wersja bez GetInputState
-            c4d.DrawViews(c4d.DRAWFLAGS_FORCEFULLREDRAW)
+            # Aktualizacja interfejsu - EventAdd() jest łączone przez C4D,
+            # bez wymuszania pełnego przerysowania widoków
             c4d.EventAdd()
 
             return True
@@ -3,10 +3,47 @@ import os
 
 from . import files_worker
 from .logger import Logger
+from .utils import format_file_size
 
 # Inicjalizacja loggera
 logger = Logger()
 
+# Rozszerzenia plików liczonych jako tekstury
+_TEX_EXT = frozenset({"jpg", "jpeg", "png", "tif", "tiff", "tga", "exr", "hdr"})
+
+
+def scan_directory(dir_path):
+    """
+    Zbiera pliki tekstur katalogu wraz z ich rozmiarami w jednym przejściu.
+
+    Args:
+        dir_path: Ścieżka do analizowanego katalogu
+
+    Returns:
+        dict: {"count": liczba plików, "total_size": suma rozmiarów w bajtach,
+               "entries": [(ścieżka, rozmiar), ...]}
+
+    Raises:
+        FileNotFoundError: Gdy katalog nie istnieje
+    """
+    entries = []
+    total_size = 0
+    with os.scandir(dir_path) as it:
+        for entry in it:
+            # Małe litery tylko dla rozszerzenia, nie całej nazwy pliku
+            _, dot, ext = entry.name.rpartition(".")
+            if (
+                dot
+                and ext.lower() in _TEX_EXT
+                and entry.is_file(follow_symlinks=False)
+            ):
+                # Na Windows rozmiar pochodzi z danych wyliczania katalogu
+                size = entry.stat(follow_symlinks=False).st_size
+                entries.append((entry.path, size))
+                total_size += size
+
+    return {"count": len(entries), "total_size": total_size, "entries": entries}
+
 
 def analyze_directory(dir_path):
     """
@@ -18,15 +55,16 @@ def analyze_directory(dir_path):
     Returns:
         str: Opis zawartości katalogu
     """
-    if not os.path.exists(dir_path):
+    try:
+        result = scan_directory(dir_path)
+    except FileNotFoundError:
         return f"Katalog {dir_path} " "nie istnieje"
 
-    files = os.listdir(dir_path)
-    image_files = [
-        f for f in files if f.lower().endswith((".jpg", ".png", ".tif", ".tga"))
-    ]
-
-    return f"Znaleziono {len(image_files)} " f"plików tekstur w katalogu {dir_path}"
+    return (
+        f"Znaleziono {result['count']} "
+        f"plików tekstur w katalogu {dir_path} "
+        f"({format_file_size(result['total_size'])})"
+    )
 
 
 def run_analysis(dir_path):
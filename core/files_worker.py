@@ -6,18 +6,135 @@ w skryptach Cinema 4D. Zawiera funkcje do zarządzania
 ścieżkami, weryfikacji plików i obsługi ustawień.
 """
 
+import errno
+import functools
 import json
+import mmap
 import os
 import shutil
-from typing import Dict
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple
 
 import c4d
 from c4d import storage
 
-from .logger import Logger
+# Opcjonalnie szybszy parser JSON - bez niego zostaje biblioteka standardowa
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-# Inicjalizacja loggera
-logger = Logger()
+
+@functools.lru_cache(maxsize=None)
+def _logger():
+    """
+    Zwraca logger pluginu, tworząc go dopiero przy pierwszym błędzie -
+    import modułu nie uruchamia konfiguracji logowania.
+    """
+    from .logger import Logger
+
+    return Logger()
+
+
+# Rozmiar bufora dla plików ustawień
+_IO_BUF = 64 * 1024
+
+# Od tego rozmiaru load_settings czyta plik przez mmap (tylko z orjson)
+_MMAP_MIN_SIZE = 1024 * 1024
+
+# Separator folderów bieżącego systemu operacyjnego
+FOLDER_SEPARATOR = os.path.sep
+
+# Czy nazwy plików porównywać bez rozróżniania wielkości liter (Windows, macOS)
+_CASE_INSENSITIVE_NAMES = not sys.platform.startswith("linux")
+
+# Katalog projektu (poziom wyżej niż pakiet core) - __file__ się nie zmienia
+_PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Katalogi raportów już utworzone: ścieżka bazowa -> katalog raportów
+_reports_dir_cache = {}
+
+
+def _json_dumps(obj) -> bytes:
+    """Serializuje obiekt do JSON (UTF-8, z wcięciami) jako bytes."""
+    if orjson is not None:
+        try:
+            # Klucze inne niż str (np. int) zamieniane na tekst, jak w json
+            return orjson.dumps(
+                obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            )
+        except TypeError:
+            # Typy, których orjson nie obsługuje (np. int > 64 bity) - json
+            pass
+    return json.dumps(obj, indent=4, ensure_ascii=False).encode("utf-8")
+
+
+def _json_loads(data: bytes):
+    """Parsuje JSON z bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _atomic_write(file_path: str, data: bytes, fsync: bool = False) -> None:
+    """
+    Zapisuje dane do pliku tymczasowego i podmienia nim plik docelowy
+    (os.replace), dzięki czemu czytelnik nigdy nie widzi częściowego zapisu.
+
+    Raises:
+        OSError: W przypadku błędu zapisu (plik tymczasowy jest usuwany)
+    """
+    tmp_path = f"{file_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb", buffering=_IO_BUF) as f:
+            f.write(data)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, file_path)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+# Liczba równoległych operacji w funkcjach *_batch
+_BATCH_WORKERS = min(8, os.cpu_count() or 1)
+
+# Pula dla operacji wsadowych - tworzona przy pierwszym użyciu
+_batch_pool = None
+
+
+def _get_batch_pool() -> ThreadPoolExecutor:
+    """Zwraca współdzieloną pulę wsadową, tworząc ją przy pierwszym użyciu."""
+    global _batch_pool
+    if _batch_pool is None:
+        _batch_pool = ThreadPoolExecutor(
+            max_workers=_BATCH_WORKERS, thread_name_prefix="txm-batch"
+        )
+    return _batch_pool
+
+
+def shutdown_batch_pool():
+    """Zatrzymuje pulę operacji wsadowych, np. przy zamykaniu pluginu."""
+    global _batch_pool
+    if _batch_pool is not None:
+        _batch_pool.shutdown(wait=False, cancel_futures=True)
+        _batch_pool = None
+
+
+def _map_batch(func, items: List) -> List:
+    """
+    Wywołuje func dla każdego elementu we współdzielonej puli wątków (operacje
+    na plikach zwalniają GIL) i zwraca wyniki w kolejności wejściowej.
+    """
+    if len(items) <= 1:
+        return [func(item) for item in items]
+
+    return list(_get_batch_pool().map(func, items))
 
 
 def get_folder_separator() -> str:
@@ -29,9 +146,10 @@ def get_folder_separator() -> str:
         str: Znak separatora folderów ('\\' dla Windows,
              '/' dla Mac/Linux)
     """
-    return os.path.sep
+    return FOLDER_SEPARATOR
 
 
+@functools.lru_cache(maxsize=16)
 def get_c4d_path(path_type=c4d.C4D_PATH_PREFS):
     """
     Pobiera ścieżkę Cinema 4D określonego typu.
@@ -53,10 +171,16 @@ def get_c4d_path(path_type=c4d.C4D_PATH_PREFS):
         str: Ścieżka do żądanego katalogu lub None,
              jeśli ścieżka nie istnieje
     """
+    # Ścieżki C4D nie zmieniają się w trakcie sesji - wynik jest zapamiętywany
     path = storage.GeGetC4DPath(path_type)
     return path if os.path.exists(path) else None
 
 
+def clear_path_cache():
+    """Czyści zapamiętane wyniki get_c4d_path (np. po zmianie preferencji)."""
+    get_c4d_path.cache_clear()
+
+
 def ensure_directory_exists(directory_path: str) -> bool:
     """
     Upewnia się, że katalog istnieje, tworząc go
@@ -70,15 +194,22 @@ def ensure_directory_exists(directory_path: str) -> bool:
               utworzony, False w przypadku błędu
     """
     try:
-        if not os.path.exists(directory_path):
-            os.makedirs(directory_path)
+        # exist_ok - jedno wywołanie, bez wyścigu między sprawdzeniem a utworzeniem
+        os.makedirs(directory_path, exist_ok=True)
         return True
     except OSError as e:
-        error_msg = "Błąd tworzenia katalogu " f"{directory_path}: " f"{e}"
-        logger.error(error_msg)
+        _logger().error("Błąd tworzenia katalogu %s: %s", directory_path, e)
         return False
 
 
+def invalidate_path_caches():
+    """
+    Czyści zapamiętane katalogi raportów - dla wywołujących,
+    którzy zmieniają system plików.
+    """
+    _reports_dir_cache.clear()
+
+
 def get_project_texture_path():
     """
     Znajduje ścieżkę dokumentu i folder tekstur dla
@@ -100,25 +231,26 @@ def get_project_texture_path():
     return doc_path, tex_path
 
 
-def create_settings_file(file_path: str, default_settings: Dict) -> bool:
+def create_settings_file(
+    file_path: str, default_settings: Dict, fsync: bool = False
+) -> bool:
     """
     Tworzy plik ustawień z domyślnymi wartościami.
 
     Args:
         file_path (str): Ścieżka do pliku ustawień
         default_settings (dict): Domyślne ustawienia
+        fsync (bool): Czy wymusić zapis na dysk przed podmianą pliku
 
     Returns:
         bool: True jeśli plik został utworzony,
               False w przypadku błędu
     """
     try:
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(default_settings, f, indent=4, ensure_ascii=False)
+        _atomic_write(file_path, _json_dumps(default_settings), fsync)
         return True
     except OSError as e:
-        error_msg = f"Błąd tworzenia pliku ustawień {file_path}: " f"{e}"
-        logger.error(error_msg)
+        _logger().error("Błąd tworzenia pliku ustawień %s: %s", file_path, e)
         return False
 
 
@@ -134,36 +266,113 @@ def load_settings(file_path: str) -> Dict:
               w przypadku błędu
     """
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(file_path, "rb", buffering=_IO_BUF) as f:
+            # Duże pliki: orjson parsuje bezpośrednio z mapowania pliku,
+            # bez kopii całej zawartości do bytes
+            if orjson is not None and os.fstat(f.fileno()).st_size > _MMAP_MIN_SIZE:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    with memoryview(mm) as view:
+                        return orjson.loads(view)
+            return _json_loads(f.read())
     except OSError as e:
-        error_msg = f"Błąd wczytywania ustawień z {file_path}: " f"{e}"
-        logger.error(error_msg)
+        _logger().error("Błąd wczytywania ustawień z %s: %s", file_path, e)
         return {}
 
 
-def save_settings(file_path: str, settings: Dict) -> bool:
+def save_settings(file_path: str, settings: Dict, fsync: bool = False) -> bool:
     """
     Zapisuje ustawienia do pliku JSON.
 
     Args:
         file_path (str): Ścieżka do pliku ustawień
         settings (dict): Ustawienia do zapisania
+        fsync (bool): Czy wymusić zapis na dysk przed podmianą pliku
 
     Returns:
         bool: True jeśli ustawienia zostały zapisane,
               False w przypadku błędu
     """
     try:
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(settings, f, indent=4, ensure_ascii=False)
+        _atomic_write(file_path, _json_dumps(settings), fsync)
         return True
     except OSError as e:
-        error_msg = f"Błąd zapisywania ustawień do {file_path}: " f"{e}"
-        logger.error(error_msg)
+        _logger().error("Błąd zapisywania ustawień do %s: %s", file_path, e)
         return False
 
 
+def load_settings_batch(file_paths: List[str]) -> List[Dict]:
+    """
+    Wczytuje wiele plików ustawień równolegle.
+
+    Args:
+        file_paths (list): Ścieżki do plików ustawień
+
+    Returns:
+        list: Wynik load_settings dla każdej ścieżki, w kolejności wejściowej
+    """
+    return _map_batch(load_settings, file_paths)
+
+
+# Błędy copy_file_range oznaczające "nieobsługiwane tutaj" - wtedy shutil.copy2
+_COPY_RANGE_FALLBACK_ERRNOS = frozenset(
+    {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EPERM}
+)
+
+
+def _copy_file_range(source_path: str, destination_path: str) -> bool:
+    """
+    Kopiuje zawartość pliku w jądrze (os.copy_file_range, Linux),
+    bez przepisywania danych przez bufor w przestrzeni użytkownika.
+
+    Returns:
+        bool: True jeśli skopiowano, False jeśli należy użyć shutil.copy2
+
+    Raises:
+        shutil.SameFileError: Gdy źródło i cel to ten sam plik
+        OSError: W przypadku innych błędów kopiowania
+    """
+    if sys.platform != "linux" or not hasattr(os, "copy_file_range"):
+        return False
+
+    if os.path.isdir(destination_path):
+        destination_path = os.path.join(
+            destination_path, os.path.basename(source_path)
+        )
+
+    # Jak shutil.copy2 - bez tego O_TRUNC wyzerowałby plik źródłowy
+    if os.path.exists(destination_path) and os.path.samefile(
+        source_path, destination_path
+    ):
+        raise shutil.SameFileError(
+            f"{source_path!r} and {destination_path!r} are the same file"
+        )
+
+    in_fd = os.open(source_path, os.O_RDONLY)
+    try:
+        remaining = os.fstat(in_fd).st_size
+        out_fd = os.open(
+            destination_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644
+        )
+        try:
+            while remaining > 0:
+                copied = os.copy_file_range(in_fd, out_fd, remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+        except OSError as e:
+            if e.errno in _COPY_RANGE_FALLBACK_ERRNOS:
+                return False
+            raise
+        finally:
+            os.close(out_fd)
+    finally:
+        os.close(in_fd)
+
+    # Metadane (czasy, uprawnienia) jak w shutil.copy2
+    shutil.copystat(source_path, destination_path)
+    return True
+
+
 def copy_file(source_path: str, destination_path: str) -> bool:
     """
     Kopiuje plik z jednej lokalizacji do drugiej.
@@ -177,17 +386,31 @@ def copy_file(source_path: str, destination_path: str) -> bool:
               False w przypadku błędu
     """
     try:
-        shutil.copy2(source_path, destination_path)
+        if not _copy_file_range(source_path, destination_path):
+            shutil.copy2(source_path, destination_path)
         return True
     except OSError as e:
-        error_msg = (
-            "Błąd kopiowania pliku z " f"{source_path} do " f"{destination_path}: {e}"
+        _logger().error(
+            "Błąd kopiowania pliku z %s do %s: %s", source_path, destination_path, e
         )
-        logger.error(error_msg)
         return False
 
 
-def generate_unique_filename(filename, folder_path):
+def copy_files_batch(pairs: List[Tuple[str, str]]) -> List[bool]:
+    """
+    Kopiuje wiele plików równolegle (pula wątków - kopiowanie zwalnia GIL
+    na czas operacji wejścia/wyjścia).
+
+    Args:
+        pairs (list): Lista par (ścieżka źródłowa, ścieżka docelowa)
+
+    Returns:
+        list: Wynik copy_file dla każdej pary, w kolejności wejściowej
+    """
+    return _map_batch(lambda pair: copy_file(*pair), pairs)
+
+
+def generate_unique_filename(filename, folder_path, reserve=False):
     """
     Generuje unikalną nazwę pliku, jeśli plik już
     istnieje.
@@ -195,30 +418,62 @@ def generate_unique_filename(filename, folder_path):
     Argumenty:
         filename (str): Oryginalna nazwa pliku
         folder_path (str): Ścieżka do folderu
+        reserve (bool): Czy od razu zarezerwować nazwę, tworząc pusty plik
+                        (O_CREAT | O_EXCL) - bezpieczne przy równoległych
+                        wywołaniach dla tego samego folderu
 
     Zwraca:
         str: Unikalna nazwa pliku
+
+    Raises:
+        OSError: Gdy reserve=True i pliku nie da się utworzyć
+                 (np. folder nie istnieje)
     """
     base_name, extension = os.path.splitext(filename)
 
-    # Sprawdź, czy nazwa podstawowa już ma licznik
-    if "_" in base_name:
-        parts = base_name.split("_")
-        last_part = parts[-1]
-        if last_part.isdigit():
-            counter = int(last_part) + 1
-            base_name = "_".join(parts[:-1])
-        else:
-            counter = 1
+    # Sprawdź, czy nazwa podstawowa już ma licznik (część po ostatnim "_")
+    head, sep, tail = base_name.rpartition("_")
+    if sep and tail.isdigit():
+        counter = int(tail) + 1
+        base_name = head
     else:
         counter = 1
 
+    # Jeden odczyt katalogu zamiast sprawdzania istnienia każdej kandydatury
+    # (poza Linuksem systemy plików zwykle nie rozróżniają wielkości liter -
+    # porównanie nazw po casefold)
+    fold = str.casefold if _CASE_INSENSITIVE_NAMES else str
+    try:
+        with os.scandir(folder_path) as entries:
+            existing = {fold(entry.name) for entry in entries}
+    except FileNotFoundError:
+        existing = set()
+    except OSError:
+        # Katalogu nie da się odczytać - sprawdzanie każdej kandydatury osobno
+        existing = None
+
     # Wygeneruj unikalną nazwę pliku
     while True:
         new_filename = f"{base_name}_{counter}{extension}"
-        new_path = os.path.join(folder_path, new_filename)
-        if not os.path.exists(new_path):
-            return new_filename
+        if existing is None:
+            taken = os.path.exists(os.path.join(folder_path, new_filename))
+        else:
+            taken = fold(new_filename) in existing
+        if not taken:
+            if not reserve:
+                return new_filename
+            try:
+                # Atomowe utworzenie - inny wątek nie dostanie tej samej nazwy
+                fd = os.open(
+                    os.path.join(folder_path, new_filename),
+                    os.O_CREAT | os.O_EXCL | os.O_WRONLY,
+                )
+            except FileExistsError:
+                # Plik powstał po odczycie katalogu - szukaj dalej
+                pass
+            else:
+                os.close(fd)
+                return new_filename
         counter += 1
 
 
@@ -240,7 +495,7 @@ def show_in_explorer(path):
         storage.ShowInFinder(path, True)
         return True
     except Exception as e:
-        logger.error(f"Błąd podczas otwierania eksploratora: {e}")
+        _logger().error("Błąd podczas otwierania eksploratora: %s", e)
         return False
 
 
@@ -256,21 +511,36 @@ def ensure_reports_directory(base_path=None):
         str: Ścieżka do katalogu raportów
     """
     if not base_path:
-        doc_path, _ = get_project_texture_path()
-        if doc_path:
-            base_path = doc_path
-        else:
-            # Fallback do katalogu projektu
-            import os
+        # Sama ścieżka dokumentu - folder tekstur nie jest tu potrzebny;
+        # bez zapisanego dokumentu fallback do katalogu projektu
+        doc = c4d.documents.GetActiveDocument()
+        doc_path = doc.GetDocumentPath() if doc is not None else None
+        base_path = doc_path or _PROJECT_DIR
 
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            base_path = os.path.dirname(script_dir)
+    reports_dir = _reports_dir_cache.get(base_path)
+    if reports_dir is not None:
+        return reports_dir
 
     reports_dir = os.path.join(base_path, "raports")
-    ensure_directory_exists(reports_dir)
+    if ensure_directory_exists(reports_dir):
+        _reports_dir_cache[base_path] = reports_dir
     return reports_dir
 
 
+def _file_ext(name: str) -> str:
+    """
+    Zwraca rozszerzenie nazwy pliku małymi literami (z kropką) lub "".
+
+    Szybszy odpowiednik os.path.splitext(name)[1].lower() dla samej nazwy
+    pliku (bez katalogu): jedno rfind, a kropki na początku nazwy nie tworzą
+    rozszerzenia (np. ".hidden" -> "").
+    """
+    dot = name.rfind(".")
+    if dot <= 0 or (name[0] == "." and not name[:dot].lstrip(".")):
+        return ""
+    return name[dot:].lower()
+
+
 def get_files_by_extension(directory, extensions=None, include_directories=False):
     """
     Pobiera listę plików w katalogu z określonymi
@@ -279,7 +549,7 @@ def get_files_by_extension(directory, extensions=None, include_directories=False
     Argumenty:
         directory (str): Katalog do przeszukania
         extensions (list): Lista rozszerzeń do filtrowania
-                          (np. ['.jpg', '.png'])
+                          (np. ['.jpg', '.png'] lub ['JPG', 'PNG'])
                           Jeśli None, wszystkie pliki są
                           zwracane
         include_directories (bool): Czy uwzględniać
@@ -289,20 +559,29 @@ def get_files_by_extension(directory, extensions=None, include_directories=False
         list: Lista ścieżek plików, które pasują do
               kryteriów
     """
-    if not os.path.exists(directory) or not os.path.isdir(directory):
+    try:
+        with os.scandir(directory) as it:
+            entries = list(it)
+    except (FileNotFoundError, NotADirectoryError):
         return []
 
-    results = []
+    # Jeden podział wpisów na pliki i katalogi, potem filtr całej listy naraz
+    # (is_dir podąża za dowiązaniami, jak os.path.isdir)
+    is_dir = [entry.is_dir() for entry in entries]
+    files = [entry for entry, d in zip(entries, is_dir) if not d]
 
-    for item in os.listdir(directory):
-        item_path = os.path.join(directory, item)
+    if extensions is None:
+        results = [entry.path for entry in files]
+    else:
+        # Rozszerzenia normalizowane raz, przed filtrem ("JPG" i ".jpg"
+        # są równoważne)
+        exts = frozenset(
+            ext.lower() if ext.startswith(".") else f".{ext.lower()}"
+            for ext in extensions
+        )
+        results = [entry.path for entry in files if _file_ext(entry.name) in exts]
 
-        if os.path.isdir(item_path):
-            if include_directories:
-                results.append(item_path)
-        else:
-            file_ext = os.path.splitext(item)[1].lower()
-            if extensions is None or file_ext in extensions:
-                results.append(item_path)
+    if include_directories:
+        results.extend(entry.path for entry, d in zip(entries, is_dir) if d)
 
     return results
@@ -14,20 +14,88 @@ Oferuje następujące funkcjonalności:
 """
 
 # logger.py
-import datetime
 import io
 import logging
 import logging.handlers
 import os
+import queue
+import re
 import sys
-import traceback
-from typing import Any, ClassVar, Dict, List, Optional, Type, Union
+import time
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
-# Import C4D tylko jeśli jest dostępne - dla elastyczności
-_C4D_AVAILABLE = False
 
+def _print_no_newline(text: str) -> None:
+    """Zapis dla append bez handlera strumienia tekstowego - print bez nowej linii."""
+    print(text, end="", flush=True)
 
-class Logger:
+
+def _noop(*args: Any, **kwargs: Any) -> None:
+    pass
+
+
+class _AppendBuffer:
+    """
+    Zbiera komunikaty append jako zakodowane bajty i zapisuje je paczkami
+    bezpośrednio do bufora binarnego strumienia tekstowego.
+
+    Zapis następuje, gdy paczka przekroczy `size` bajtów, a także przed każdym
+    zwykłym rekordem, wydrukiem samego loggera i przy zamknięciu loggera (flush).
+    """
+
+    __slots__ = ("_stream", "_encoding", "_pending", "size")
+
+    def __init__(self, stream: io.TextIOWrapper, size: int = 4096) -> None:
+        self._stream = stream
+        self._encoding = stream.encoding or "utf-8"
+        self._pending = bytearray()
+        self.size = size
+
+    def write(self, text: str) -> None:
+        self._pending += text.encode(self._encoding, "replace")
+
+    def flush_if_due(self) -> None:
+        if len(self._pending) >= self.size:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._pending:
+            return
+        # Najpierw warstwa tekstowa - wcześniejsze wydruki (np. print bez
+        # flush) nie mogą pojawić się po komunikacie append
+        self._stream.flush()
+        self._stream.buffer.write(self._pending)
+        self._stream.buffer.flush()
+        self._pending.clear()
+
+
+class _LoggerMeta(type):
+    """
+    Metaklasa singletona Loggera - kolejne wywołania Logger() zwracają gotową
+    instancję bez ponownego wywołania __init__.
+    """
+
+    def __call__(cls):
+        instance = cls._instance
+        if instance is None:
+            instance = cls._instance = super().__call__()
+        elif not cls._initialized:
+            # Poprzednia inicjalizacja nieudana - ponowna próba na tej samej instancji
+            instance.__init__()
+        return instance
+
+
+class Logger(metaclass=_LoggerMeta):
     """
     Klasa implementująca wzorzec Singleton do centralnego zarządzania logowaniem.
 
@@ -54,6 +122,8 @@ class Logger:
         - Zapisuje do pliku `logs/log.log` z automatyczną rotacją dzienną.
         - Przechowuje 7 ostatnich zrotowanych plików logów.
         - Format pliku jest zawsze szczegółowy.
+        - Zapis do pliku odbywa się w wątku tła (QueueHandler/QueueListener),
+          z buforowaniem - na dysk trafia paczkami, od ERROR wzwyż od razu.
     - W logach (konsola w trybach DEBUG/CRITICAL i plik) zawiera informację
       o pliku i numerze linii *faktycznego miejsca wywołania* funkcji
       logującej (np. `log.info()` w `txm.pyp`), dzięki użyciu `stacklevel=2`.
@@ -84,6 +154,12 @@ class Logger:
     LOG_DIRECTORY: ClassVar[str] = "logs"
     LOG_FILENAME_PREFIX: ClassVar[str] = "log"
 
+    # Ścieżki wyznaczane raz przy imporcie - __file__ się nie zmienia;
+    # katalog logów jest poziom wyżej niż ten skrypt
+    _SCRIPT_DIR: ClassVar[str] = os.path.dirname(os.path.abspath(__file__))
+    _LOG_DIR: ClassVar[str] = os.path.join(os.path.dirname(_SCRIPT_DIR), LOG_DIRECTORY)
+    _LOG_FILE_PATH: ClassVar[str] = os.path.join(_LOG_DIR, f"{LOG_FILENAME_PREFIX}.log")
+
     # --- Formaty Logowania ---
     # Zmodyfikowane formaty konsoli z różnymi znakami ASCII
     # dla różnych poziomów
@@ -103,6 +179,12 @@ class Logger:
         "⚠⚠⚠ CRITICAL [%(asctime)s]: %(filename)s:%(lineno)d → %(message)s"
     )
     # Nowe formaty dla trybu CRITICAL
+    CONSOLE_FORMAT_INFO_CRITICAL: ClassVar[str] = (
+        "ℹ [%(asctime)s] %(levelname)-7s: %(filename)s:%(lineno)d → %(message)s"
+    )
+    CONSOLE_FORMAT_DEBUG_CRITICAL: ClassVar[str] = (
+        "⚙ [%(asctime)s] %(levelname)-7s: %(filename)s:%(lineno)d → %(message)s"
+    )
     CONSOLE_FORMAT_WARNING_CRITICAL: ClassVar[str] = (
         "⚠ [%(asctime)s] %(levelname)-7s: %(filename)s:%(lineno)d → %(message)s"
     )
@@ -117,39 +199,116 @@ class Logger:
     )
 
     LOG_DATE_FORMAT: ClassVar[str] = "%H:%M:%S"
+
+    # Metody logujące wyłączane w trybie NONE (_bind_log_methods)
+    _LOG_METHODS: ClassVar[Tuple[str, ...]] = (
+        "debug",
+        "info",
+        "warning",
+        "error",
+        "critical",
+        "exception",
+    )
+
+    # Tryby akceptowane przez set_logging_mode ("ERROR" - wsteczna
+    # kompatybilność, mapowany na DEBUG)
+    _VALID_MODES: ClassVar[FrozenSet[Union[int, str]]] = frozenset(
+        (LOG_MODE_NONE, LOG_MODE_INFO, LOG_MODE_DEBUG, LOG_MODE_CRITICAL, "ERROR")
+    )
+
+    # Tryby szczegółowe: przepuszczają DEBUG, włączają logowanie do pliku i są
+    # jedynymi, w których działają WARNING/ERROR (w trybie INFO są ukrywane,
+    # mimo że ich poziom jest wyższy niż INFO)
+    _MODES_DETAILED: ClassVar[FrozenSet[Union[int, str]]] = frozenset(
+        (LOG_MODE_DEBUG, LOG_MODE_CRITICAL)
+    )
+
+    # Poziom loggera i handlera konsoli dla trybu logowania; w trybie CRITICAL
+    # pokazujemy WSZYSTKIE poziomy (od DEBUG wzwyż), ale z rozszerzonym formatem
+    _MODE_LEVELS: ClassVar[Dict[Union[int, str], int]] = {
+        LOG_MODE_NONE: logging.CRITICAL + 1,
+        LOG_MODE_INFO: logging.INFO,
+        LOG_MODE_DEBUG: logging.DEBUG,
+        LOG_MODE_CRITICAL: logging.DEBUG,
+    }
     STACKLEVEL: ClassVar[int] = 2
 
-    def __new__(cls: Type["Logger"]) -> "Logger":
-        if cls._instance is None:
-            cls._instance = super(Logger, cls).__new__(cls)
-        return cls._instance
+    # Komunikaty append: rozmiar paczki [B]
+    APPEND_BUFFER_SIZE: ClassVar[int] = 4096
+
+    # Plik logu: rozmiar bufora i liczba rekordów, po której bufor jest zapisywany
+    FILE_BUFFER_SIZE: ClassVar[int] = 64 * 1024
+    FILE_FLUSH_CAPACITY: ClassVar[int] = 1024
 
     def __init__(self) -> None:
-        if Logger._initialized:
-            return
+        # Zapis dla append - ustalany raz przy konfiguracji handlera konsoli
+        self._reset_append_writer()
 
         # Lista na komunikaty inicjalizacyjne z dodatkowym poziomem szczegółowości
         init_messages: List[str] = []
         is_init_successful = True
 
         try:
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-
             # Wywołanie zmodyfikowanej metody do sprawdzania plików kontrolnych
             initial_mode, file_logging_enabled = self._check_control_files()
 
             self.logger = logging.getLogger("logger")
-            # Kluczowe: ustawienie poziomu loggera na najniższy możliwy poziom, aby przepuszczał wszystko
+            # Na czas konfiguracji logger przepuszcza wszystko - poziom zgodny z trybem
+            # ustawiany jest po konfiguracji handlerów
             self.logger.setLevel(logging.DEBUG)
             self.logger.propagate = False
 
+            # Metoda logująca -> (poziom, tryby, w których działa, gdy sam
+            # poziom nie wystarcza, metoda loggera, domyślny stacklevel);
+            # metody loggera pobierane raz
+            self._dispatch: Dict[
+                str, Tuple[int, Optional[FrozenSet], Callable, int]
+            ] = {
+                "debug": (
+                    logging.DEBUG,
+                    None,
+                    self.logger.debug,
+                    Logger.STACKLEVEL,
+                ),
+                "info": (
+                    logging.INFO,
+                    None,
+                    self.logger.info,
+                    Logger.STACKLEVEL + 1,
+                ),
+                "warning": (
+                    logging.WARNING,
+                    Logger._MODES_DETAILED,
+                    self.logger.warning,
+                    Logger.STACKLEVEL + 1,
+                ),
+                "error": (
+                    logging.ERROR,
+                    Logger._MODES_DETAILED,
+                    self.logger.error,
+                    Logger.STACKLEVEL + 1,
+                ),
+                "critical": (
+                    logging.CRITICAL,
+                    None,
+                    self.logger.critical,
+                    Logger.STACKLEVEL + 1,
+                ),
+                "exception": (
+                    logging.ERROR,
+                    None,
+                    self.logger.exception,
+                    Logger.STACKLEVEL + 1,
+                ),
+            }
+
             self.log_file: Optional[str] = None
             self.console_handler: Optional[logging.Handler] = None
             self.file_handler: Optional[logging.Handler] = None
+            self._queue_handler: Optional[logging.Handler] = None
+            self._queue_listener: Optional[logging.handlers.QueueListener] = None
 
-            self.log_dir = os.path.join(
-                os.path.dirname(script_dir), Logger.LOG_DIRECTORY
-            )
+            self.log_dir = Logger._LOG_DIR
 
             # Ustawienie zmiennej klasowej i instancji
             Logger.FILE_LOGGING_ENABLED = file_logging_enabled
@@ -173,10 +332,7 @@ class Logger:
                     )
                 else:
                     # Skonfiguruj plik, jeśli tryb tego wymaga
-                    if file_logging_enabled and initial_mode in [
-                        Logger.LOG_MODE_DEBUG,
-                        Logger.LOG_MODE_CRITICAL,
-                    ]:
+                    if file_logging_enabled and initial_mode in Logger._MODES_DETAILED:
                         if not self._configure_file_handler():
                             init_messages.append(
                                 f"Ostrzeżenie: Nie udało się skonfigurować handlera pliku."
@@ -191,6 +347,10 @@ class Logger:
                 # Jeśli tryb początkowy to NONE, zapisujemy stan
                 self.logging_mode = Logger.LOG_MODE_NONE
 
+            # Poziom loggera zgodny z trybem (także po błędzie handlera konsoli)
+            self.logger.setLevel(Logger._MODE_LEVELS[self.logging_mode])
+            self._bind_log_methods()
+
         except Exception as e:
             is_init_successful = False
             critical_error = True
@@ -214,26 +374,9 @@ class Logger:
         if not self.console_handler:
             return
 
-        # Usunięcie wszystkich istniejących filtrów
-        for filter in self.console_handler.filters[:]:
-            self.console_handler.removeFilter(filter)
-
-        if mode == Logger.LOG_MODE_NONE:
-            # Wyłączamy wszystkie logi
-            self.console_handler.setLevel(logging.CRITICAL + 1)
-        elif mode == Logger.LOG_MODE_INFO:
-            # Ustawiamy poziom na INFO
-            self.console_handler.setLevel(logging.INFO)
-        elif mode == Logger.LOG_MODE_DEBUG:
-            # Pokazujemy wszystkie logi od DEBUG wzwyż
-            self.console_handler.setLevel(logging.DEBUG)
-        elif mode == Logger.LOG_MODE_CRITICAL:
-            # W trybie CRITICAL pokazujemy WSZYSTKIE poziomy (od DEBUG wzwyż)
-            # ale z rozszerzonym formatem
-            self.console_handler.setLevel(logging.DEBUG)  # Zmiana z WARNING na DEBUG
-        else:
-            # Nieznany tryb - ustawiamy na INFO jako domyślny
-            self.console_handler.setLevel(logging.INFO)
+        # Sam próg poziomu (porównanie liczb w logging) - bez filtrów
+        # wywoływanych w Pythonie dla każdego rekordu; nieznany tryb -> INFO
+        self.console_handler.setLevel(Logger._MODE_LEVELS.get(mode, logging.INFO))
 
     def _configure_console_handler(self) -> bool:
         """Konfiguruje handler konsoli. Zwraca True w przypadku sukcesu."""
@@ -241,38 +384,45 @@ class Logger:
             self.console_handler = logging.StreamHandler(sys.stdout)
             self.console_handler.setLevel(logging.DEBUG)  # Poziom zostanie dostosowany
 
-            # Dodanie formaterów dla trybu CRITICAL z datą/czasem
-            self.critical_formatters = {
-                logging.WARNING: logging.Formatter(
-                    fmt=Logger.CONSOLE_FORMAT_WARNING_CRITICAL,
-                    datefmt=Logger.LOG_DATE_FORMAT,
-                ),
-                logging.ERROR: logging.Formatter(
-                    fmt=Logger.CONSOLE_FORMAT_ERROR_CRITICAL,
-                    datefmt=Logger.LOG_DATE_FORMAT,
-                ),
-                logging.CRITICAL: logging.Formatter(
-                    fmt=Logger.CONSOLE_FORMAT_CRITICAL_CRITICAL,
-                    datefmt=Logger.LOG_DATE_FORMAT,
-                ),
-            }
+            # Formatery tworzone raz - zmiana trybu tylko je przełącza
+            self._fmt_normal = LevelSpecificFormatter(
+                info_fmt=Logger.CONSOLE_FORMAT_INFO,
+                debug_fmt=Logger.CONSOLE_FORMAT_DEBUG,
+                warning_fmt=Logger.CONSOLE_FORMAT_WARNING,
+                error_fmt=Logger.CONSOLE_FORMAT_ERROR,
+                critical_fmt=Logger.CONSOLE_FORMAT_CRITICAL,
+                datefmt=Logger.LOG_DATE_FORMAT,
+            )
+            # Tryb CRITICAL: formaty z datą/czasem dla WSZYSTKICH poziomów
+            self._fmt_critical = LevelSpecificFormatter(
+                info_fmt=Logger.CONSOLE_FORMAT_INFO_CRITICAL,
+                debug_fmt=Logger.CONSOLE_FORMAT_DEBUG_CRITICAL,
+                warning_fmt=Logger.CONSOLE_FORMAT_WARNING_CRITICAL,
+                error_fmt=Logger.CONSOLE_FORMAT_ERROR_CRITICAL,
+                critical_fmt=Logger.CONSOLE_FORMAT_CRITICAL_CRITICAL,
+                datefmt=Logger.LOG_DATE_FORMAT,
+            )
 
             # Standardowy formatter dla innych trybów
-            self.console_handler.setFormatter(
-                LevelSpecificFormatter(
-                    info_fmt=Logger.CONSOLE_FORMAT_INFO,
-                    debug_fmt=Logger.CONSOLE_FORMAT_DEBUG,
-                    warning_fmt=Logger.CONSOLE_FORMAT_WARNING,
-                    error_fmt=Logger.CONSOLE_FORMAT_ERROR,
-                    critical_fmt=Logger.CONSOLE_FORMAT_CRITICAL,
-                    datefmt=Logger.LOG_DATE_FORMAT,
-                )
-            )
+            self.console_handler.setFormatter(self._fmt_normal)
+
+            # Strumień dla append sprawdzany raz, nie przy każdym wywołaniu
+            stream = self.console_handler.stream
+            if isinstance(stream, io.TextIOWrapper):
+                # Zapis zakodowanych bajtów bezpośrednio do bufora strumienia,
+                # z pominięciem warstwy tekstowej, paczkami zamiast write+flush
+                # przy każdym wywołaniu
+                append_buffer = _AppendBuffer(stream, size=Logger.APPEND_BUFFER_SIZE)
+                self._append_write = append_buffer.write
+                self._append_flush = append_buffer.flush_if_due
+                self._append_drain = append_buffer.flush
+            else:
+                self._reset_append_writer()
 
             self.logger.addHandler(self.console_handler)
             return True
         except Exception as e:
-            print(f"Błąd podczas konfiguracji handlera konsoli: {str(e)}")
+            self._print(f"Błąd podczas konfiguracji handlera konsoli: {str(e)}")
             return False
 
     def _configure_file_handler(self) -> bool:
@@ -285,19 +435,19 @@ class Logger:
             if not self._ensure_log_directory():
                 return False
 
-            # Tworzenie pełnej ścieżki do pliku logu
-            self.log_file = os.path.join(
-                self.log_dir,
-                f"{Logger.LOG_FILENAME_PREFIX}.log",
-            )
+            # Pełna ścieżka do pliku logu (wyznaczona przy imporcie)
+            self.log_file = Logger._LOG_FILE_PATH
 
-            # Konfiguracja handlera pliku z rotacją dzienną
-            self.file_handler = logging.handlers.TimedRotatingFileHandler(
+            # Konfiguracja handlera pliku z rotacją dzienną; rekordy zbierane
+            # w buforze i zapisywane paczkami (zawsze od razu od ERROR wzwyż)
+            self.file_handler = BufferedTimedRotatingFileHandler(
                 self.log_file,
                 when="midnight",
                 interval=1,
                 backupCount=7,
                 encoding="utf-8",
+                capacity=Logger.FILE_FLUSH_CAPACITY,
+                flush_level=logging.ERROR,
             )
 
             # Ustawienie formatera dla pliku
@@ -306,14 +456,23 @@ class Logger:
             )
             self.file_handler.setFormatter(file_formatter)
 
-            # Dodanie handlera do loggera
-            self.logger.addHandler(self.file_handler)
-
             # Ustawienie poziomu logowania na DEBUG, aby zapisywać wszystkie komunikaty
             self.file_handler.setLevel(
                 logging.DEBUG
             )  # Dodana linia - ustawienie poziomu logowania
 
+            # Zapis do pliku w osobnym wątku - wywołujący (wątek UI C4D) tylko
+            # wrzuca rekord do kolejki i nie czeka na operacje dyskowe
+            log_queue = queue.SimpleQueue()
+            self._queue_handler = logging.handlers.QueueHandler(log_queue)
+            self._queue_listener = logging.handlers.QueueListener(
+                log_queue, self.file_handler, respect_handler_level=True
+            )
+            self._queue_listener.start()
+
+            # Dodanie handlera kolejki do loggera
+            self.logger.addHandler(self._queue_handler)
+
             return True
         except Exception as e:
             self.logger.error(
@@ -322,6 +481,21 @@ class Logger:
             )
             return False
 
+    def _close_file_handler(self) -> None:
+        """Zatrzymuje wątek zapisu logów i zamyka handler pliku."""
+        if self._queue_handler:
+            self.logger.removeHandler(self._queue_handler)
+            self._queue_handler = None
+
+        if self._queue_listener:
+            # stop() czeka na zapisanie wszystkich rekordów z kolejki
+            self._queue_listener.stop()
+            self._queue_listener = None
+
+        if self.file_handler:
+            self.file_handler.close()
+            self.file_handler = None
+
     def _ensure_log_directory(self) -> bool:
         """Upewnia się, że katalog logów istnieje."""
         if not os.path.exists(self.log_dir):
@@ -337,7 +511,9 @@ class Logger:
                 return True
             except OSError as e:
                 # Zostawiamy ten print, ponieważ dotyczy krytycznego błędu
-                print(f"Nie można utworzyć katalogu logów: {self.log_dir}. Błąd: {e}")
+                self._print(
+                    f"Nie można utworzyć katalogu logów: {self.log_dir}. Błąd: {e}"
+                )
                 if self.logger.hasHandlers():
                     self.critical(
                         f"Nie można utworzyć katalogu logów: {self.log_dir}. Błąd: {e}",
@@ -350,23 +526,24 @@ class Logger:
         """Ustawia tryb logowania. Zwraca True w przypadku sukcesu."""
         try:
             # Walidacja trybu
-            if mode not in [
-                Logger.LOG_MODE_NONE,
-                Logger.LOG_MODE_INFO,
-                Logger.LOG_MODE_DEBUG,
-                Logger.LOG_MODE_CRITICAL,
-                "ERROR",  # Dodanie obsługi trybu ERROR dla wstecznej kompatybilności
-            ]:
-                print(f"Nieznany tryb logowania: {mode}")
+            if mode not in Logger._VALID_MODES:
+                self._print(f"Nieznany tryb logowania: {mode}")
                 return False
 
             # Obsługa trybu ERROR (mapowanie na tryb DEBUG)
             if mode == "ERROR":
                 mode = Logger.LOG_MODE_DEBUG  # Traktuj ERROR tak samo jak DEBUG
 
-            # Ustawienie trybu
+            # Ten sam tryb przy skonfigurowanym handlerze - nic do zmiany
+            if mode == self.logging_mode and self.console_handler is not None:
+                return True
+
+            # Ustawienie trybu - poziom loggera odpowiada trybowi, dzięki czemu
+            # isEnabledFor w _emit odrzuca wyłączone poziomy bez dalszej pracy
             self.logging_mode = mode
-            print(f"Ustawianie trybu logowania na: {mode}")
+            self.logger.setLevel(Logger._MODE_LEVELS[mode])
+            self._bind_log_methods()
+            self._print(f"Ustawianie trybu logowania na: {mode}")
 
             # Konfiguracja handlera konsoli
             if mode != Logger.LOG_MODE_NONE:
@@ -381,49 +558,25 @@ class Logger:
                 if mode == Logger.LOG_MODE_CRITICAL:
                     # Użyj specjalnych formaterów z datą/czasem dla WSZYSTKICH poziomów
                     if self.console_handler:
-                        print(
+                        self._print(
                             "Ustawianie formatowania dla trybu CRITICAL z datą/czasem"
                         )
-                        self.console_handler.setFormatter(
-                            LevelSpecificFormatter(
-                                # Dodajemy formaty z datą/czasem dla DEBUG i INFO
-                                info_fmt="ℹ [%(asctime)s] %(levelname)-7s: %(filename)s:%(lineno)d → %(message)s",
-                                debug_fmt="⚙ [%(asctime)s] %(levelname)-7s: %(filename)s:%(lineno)d → %(message)s",
-                                warning_fmt=Logger.CONSOLE_FORMAT_WARNING_CRITICAL,
-                                error_fmt=Logger.CONSOLE_FORMAT_ERROR_CRITICAL,
-                                critical_fmt=Logger.CONSOLE_FORMAT_CRITICAL_CRITICAL,
-                                datefmt=Logger.LOG_DATE_FORMAT,
-                            )
-                        )
+                        self.console_handler.setFormatter(self._fmt_critical)
                 else:
                     # Standardowe formatery dla innych trybów
                     if self.console_handler:
-                        self.console_handler.setFormatter(
-                            LevelSpecificFormatter(
-                                info_fmt=Logger.CONSOLE_FORMAT_INFO,
-                                debug_fmt=Logger.CONSOLE_FORMAT_DEBUG,
-                                warning_fmt=Logger.CONSOLE_FORMAT_WARNING,
-                                error_fmt=Logger.CONSOLE_FORMAT_ERROR,
-                                critical_fmt=Logger.CONSOLE_FORMAT_CRITICAL,
-                                datefmt=Logger.LOG_DATE_FORMAT,
-                            )
-                        )
+                        self.console_handler.setFormatter(self._fmt_normal)
 
             # Konfiguracja handlera pliku
-            if (
-                mode in [Logger.LOG_MODE_DEBUG, Logger.LOG_MODE_CRITICAL]
-                and self.file_logging_enabled
-            ):
+            if mode in Logger._MODES_DETAILED and self.file_logging_enabled:
                 if not self.file_handler:
                     self._configure_file_handler()
             else:
-                if self.file_handler:
-                    self.logger.removeHandler(self.file_handler)
-                    self.file_handler = None
+                self._close_file_handler()
 
             return True
         except Exception as e:
-            print(f"Błąd podczas ustawiania trybu logowania: {str(e)}")
+            self._print(f"Błąd podczas ustawiania trybu logowania: {str(e)}")
             return False
 
     def close(self) -> None:
@@ -434,6 +587,9 @@ class Logger:
         if not Logger._initialized:
             return
 
+        # Zaległe komunikaty append przed komunikatem o zamykaniu
+        self._append_drain()
+
         self.logger.debug(
             "Zamykanie Loggera i zwalnianie zasobów...", stacklevel=Logger.STACKLEVEL
         )
@@ -443,44 +599,126 @@ class Logger:
             self.logger.removeHandler(self.console_handler)
             self.console_handler.close()
             self.console_handler = None
+            self._reset_append_writer()
 
-        # Zamknij handler pliku
-        if self.file_handler:
-            self.logger.removeHandler(self.file_handler)
-            self.file_handler.close()
-            self.file_handler = None
+        # Zamknij handler pliku (opróżnia kolejkę przed zamknięciem pliku)
+        self._close_file_handler()
 
         # Nie resetujemy _initialized, aby zapobiec ponownemu tworzeniu loggera
         # gdy użytkownik przypadkowo wywoła Logger() po close()
         self.logging_mode = Logger.LOG_MODE_NONE
+        self.logger.setLevel(Logger._MODE_LEVELS[Logger.LOG_MODE_NONE])
+        self._bind_log_methods()
         self.log_file = None
 
-    # --- Metody publiczne do logowania ---
+    def is_debug_enabled(self) -> bool:
+        """Zwraca True, jeśli bieżący tryb logowania przepuszcza DEBUG."""
+        return self.logging_mode in Logger._MODES_DETAILED
 
-    def debug(self, message: str, *args: Any, **kwargs: Any) -> None:
+    def set_lean_records(self, enabled: bool) -> None:
         """
-        Loguje wiadomość na poziomie DEBUG.
+        Włącza lub wyłącza zbieranie danych procesu/wątku w LogRecord.
+
+        Formaty loggera tych danych nie używają, więc po włączeniu LogRecord
+        nie wywołuje os.getpid(), threading.current_thread() ani sprawdzenia
+        multiprocessing przy każdym rekordzie. Flagi modułu logging są globalne
+        dla całego interpretera, współdzielonego w C4D z innymi pluginami -
+        dlatego domyślnie wyłączone.
+        """
+        collect = not enabled
+        logging.logProcesses = collect
+        logging.logThreads = collect
+        logging.logMultiprocessing = collect
+
+    def _print(self, text: str) -> None:
+        """Wydruk komunikatu samego loggera - po zaległych komunikatach append."""
+        self._append_drain()
+        print(text)
+
+    def _reset_append_writer(self) -> None:
+        """Przywraca zapis append przez print (bez handlera strumienia tekstowego)."""
+        self._append_write = _print_no_newline
+        self._append_flush = _noop
+        self._append_drain = _noop
+
+    def _bind_log_methods(self) -> None:
+        """
+        W trybie NONE zastępuje metody logujące funkcją no-op (atrybuty
+        instancji przesłaniają metody klasy), w pozostałych trybach
+        przywraca metody klasy.
+        """
+        if self.logging_mode == Logger.LOG_MODE_NONE:
+            for name in Logger._LOG_METHODS:
+                setattr(self, name, _noop)
+        else:
+            for name in Logger._LOG_METHODS:
+                self.__dict__.pop(name, None)
+
+    # --- Metody publiczne do logowania ---
+
+    def _emit(
+        self,
+        name: str,
+        message: str,
+        args: tuple,
+        append: bool,
+        stacklevel: Optional[int],
+        kwargs: dict,
+    ) -> None:
         """
-        if self.logging_mode in [Logger.LOG_MODE_NONE, Logger.LOG_MODE_INFO]:
-            return  # Nie pokazuj DEBUG w trybie NONE ani INFO
+        Wspólna implementacja metod logujących: sprawdza tryb, obsługuje
+        append i przekazuje wiadomość do odpowiedniej metody loggera.
 
-        # Poprawne ustawienie stacklevel
-        kwargs["stacklevel"] = kwargs.get("stacklevel", Logger.STACKLEVEL)
-        append = kwargs.pop("append", False)
+        Args:
+            name: Nazwa metody logującej (klucz w self._dispatch)
+            message: Wiadomość do zalogowania
+            args: Argumenty pozycyjne dla metody loggera
+            append: Czy dopisać wiadomość do bieżącej linii (bez formatowania)
+            stacklevel: stacklevel wywołującego lub None (domyślny dla metody)
+            kwargs: Pozostałe argumenty słownikowe dla metody loggera
+        """
+        level, allowed_modes, log_func, default_stacklevel = self._dispatch[name]
+        # Poziom loggera odpowiada trybowi - wyłączone poziomy kończą tutaj
+        if not self.logger.isEnabledFor(level):
+            return
+        if allowed_modes is not None and self.logging_mode not in allowed_modes:
+            return
 
         if append:
             # Obsługa append
-            if self.console_handler and isinstance(
-                self.console_handler.stream, io.TextIOWrapper
-            ):
-                self.console_handler.stream.write(f"\r{message}")
-                self.console_handler.stream.flush()
-            else:
-                print(f"\r{message}", end="", flush=True)
-        else:
-            self.logger.debug(message, *args, **kwargs)
+            self._append_write(f"\r{message}")
+            self._append_flush()
+            return
+
+        # Zaległe komunikaty append przed zwykłym rekordem - zachowanie kolejności
+        self._append_drain()
+
+        if stacklevel is None:
+            stacklevel = default_stacklevel
+        # +1 - ramka _emit między wywołującym a metodą loggera
+        log_func(message, *args, stacklevel=stacklevel + 1, **kwargs)
+
+    def debug(
+        self,
+        message: str,
+        *args: Any,
+        append: bool = False,
+        stacklevel: Optional[int] = None,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Loguje wiadomość na poziomie DEBUG.
+        """
+        self._emit("debug", message, args, append, stacklevel, kwargs)
 
-    def info(self, message: str, *args: Any, **kwargs: Any) -> None:
+    def info(
+        self,
+        message: str,
+        *args: Any,
+        append: bool = False,
+        stacklevel: Optional[int] = None,
+        **kwargs: Any,
+    ) -> None:
         """
         Loguje wiadomość na poziomie INFO.
 
@@ -488,31 +726,19 @@ class Logger:
             message: Wiadomość do zalogowania
             *args: Dodatkowe argumenty dla logger.info
             append: Jeśli True, dodaje wiadomość do poprzedniej linii bez nowej linii
+            stacklevel: Poziom stosu miejsca wywołania (domyślnie wywołujący)
             **kwargs: Dodatkowe argumenty słownikowe dla logger.info
         """
-        if self.logging_mode == Logger.LOG_MODE_NONE:
-            return
-
-        # Poprawne ustawienie stacklevel
-        kwargs["stacklevel"] = kwargs.get("stacklevel", Logger.STACKLEVEL + 1)
-        append = kwargs.pop("append", False)
+        self._emit("info", message, args, append, stacklevel, kwargs)
 
-        if append:
-            # Używamy własnego handlera do obsługi append zamiast print
-            if self.console_handler and isinstance(
-                self.console_handler.stream, io.TextIOWrapper
-            ):
-                # Wydrukuj tylko samą wiadomość bez formatowania
-                self.console_handler.stream.write(f"\r{message}")
-                self.console_handler.stream.flush()
-            else:
-                # Fallback na print jeśli brak console_handler
-                print(f"\r{message}", end="", flush=True)
-        else:
-            # Używamy prawidłowej metody info() zamiast debug()
-            self.logger.info(message, *args, **kwargs)
-
-    def warning(self, message: str, *args: Any, **kwargs: Any) -> None:
+    def warning(
+        self,
+        message: str,
+        *args: Any,
+        append: bool = False,
+        stacklevel: Optional[int] = None,
+        **kwargs: Any,
+    ) -> None:
         """
         Loguje wiadomość na poziomie WARNING.
 
@@ -520,27 +746,19 @@ class Logger:
             message: Wiadomość do zalogowania
             *args: Dodatkowe argumenty dla logger.warning
             append: Jeśli True, dodaje wiadomość do poprzedniej linii bez nowej linii
+            stacklevel: Poziom stosu miejsca wywołania (domyślnie wywołujący)
             **kwargs: Dodatkowe argumenty słownikowe dla logger.warning
         """
-        if self.logging_mode in [Logger.LOG_MODE_NONE, Logger.LOG_MODE_INFO]:
-            return  # Nie pokazuj WARNING w trybie NONE ani INFO
-
-        kwargs["stacklevel"] = kwargs.get("stacklevel", Logger.STACKLEVEL + 1)
-        append = kwargs.pop("append", False)
+        self._emit("warning", message, args, append, stacklevel, kwargs)
 
-        if append:
-            # Obsługa append
-            if self.console_handler and isinstance(
-                self.console_handler.stream, io.TextIOWrapper
-            ):
-                self.console_handler.stream.write(f"\r{message}")
-                self.console_handler.stream.flush()
-            else:
-                print(f"\r{message}", end="", flush=True)
-        else:
-            self.logger.warning(message, *args, **kwargs)
-
-    def error(self, message: str, *args: Any, **kwargs: Any) -> None:
+    def error(
+        self,
+        message: str,
+        *args: Any,
+        append: bool = False,
+        stacklevel: Optional[int] = None,
+        **kwargs: Any,
+    ) -> None:
         """
         Loguje wiadomość na poziomie ERROR.
 
@@ -548,27 +766,19 @@ class Logger:
             message: Wiadomość do zalogowania
             *args: Dodatkowe argumenty dla logger.error
             append: Jeśli True, dodaje wiadomość do poprzedniej linii bez nowej linii
+            stacklevel: Poziom stosu miejsca wywołania (domyślnie wywołujący)
             **kwargs: Dodatkowe argumenty słownikowe dla logger.error
         """
-        if self.logging_mode in [Logger.LOG_MODE_NONE, Logger.LOG_MODE_INFO]:
-            return  # Nie pokazuj ERROR w trybie NONE ani INFO
+        self._emit("error", message, args, append, stacklevel, kwargs)
 
-        kwargs["stacklevel"] = kwargs.get("stacklevel", Logger.STACKLEVEL + 1)
-        append = kwargs.pop("append", False)
-
-        if append:
-            # Obsługa append
-            if self.console_handler and isinstance(
-                self.console_handler.stream, io.TextIOWrapper
-            ):
-                self.console_handler.stream.write(f"\r{message}")
-                self.console_handler.stream.flush()
-            else:
-                print(f"\r{message}", end="", flush=True)
-        else:
-            self.logger.error(message, *args, **kwargs)
-
-    def critical(self, message: str, *args: Any, **kwargs: Any) -> None:
+    def critical(
+        self,
+        message: str,
+        *args: Any,
+        append: bool = False,
+        stacklevel: Optional[int] = None,
+        **kwargs: Any,
+    ) -> None:
         """
         Loguje wiadomość na poziomie CRITICAL.
 
@@ -576,27 +786,19 @@ class Logger:
             message: Wiadomość do zalogowania
             *args: Dodatkowe argumenty dla logger.critical
             append: Jeśli True, dodaje wiadomość do poprzedniej linii bez nowej linii
+            stacklevel: Poziom stosu miejsca wywołania (domyślnie wywołujący)
             **kwargs: Dodatkowe argumenty słownikowe dla logger.critical
         """
-        if self.logging_mode == Logger.LOG_MODE_NONE:
-            return  # Nie pokazuj CRITICAL tylko w trybie NONE
-
-        kwargs["stacklevel"] = kwargs.get("stacklevel", Logger.STACKLEVEL + 1)
-        append = kwargs.pop("append", False)
-
-        if append:
-            # Obsługa append
-            if self.console_handler and isinstance(
-                self.console_handler.stream, io.TextIOWrapper
-            ):
-                self.console_handler.stream.write(f"\r{message}")
-                self.console_handler.stream.flush()
-            else:
-                print(f"\r{message}", end="", flush=True)
-        else:
-            self.logger.critical(message, *args, **kwargs)
+        self._emit("critical", message, args, append, stacklevel, kwargs)
 
-    def exception(self, message: str, *args: Any, **kwargs: Any) -> None:
+    def exception(
+        self,
+        message: str,
+        *args: Any,
+        append: bool = False,
+        stacklevel: Optional[int] = None,
+        **kwargs: Any,
+    ) -> None:
         """
         Loguje wiadomość na poziomie ERROR z informacją o wyjątku.
 
@@ -604,32 +806,14 @@ class Logger:
             message: Wiadomość do zalogowania
             *args: Dodatkowe argumenty dla logger.exception
             append: Jeśli True, dodaje wiadomość do poprzedniej linii bez nowej linii
+            stacklevel: Poziom stosu miejsca wywołania (domyślnie wywołujący)
             **kwargs: Dodatkowe argumenty słownikowe dla logger.exception
         """
-        if self.logging_mode == Logger.LOG_MODE_NONE:
-            return
-
-        kwargs["stacklevel"] = kwargs.get("stacklevel", Logger.STACKLEVEL + 1)
-        append = kwargs.pop("append", False)
-
-        if self.logger.isEnabledFor(logging.ERROR):
-            if append:
-                # Używamy własnego handlera do obsługi append zamiast print
-                if self.console_handler and isinstance(
-                    self.console_handler.stream, io.TextIOWrapper
-                ):
-                    # Wydrukuj tylko samą wiadomość bez formatowania
-                    self.console_handler.stream.write(f"\r{message}")
-                    self.console_handler.stream.flush()
-                else:
-                    # Fallback na print jeśli brak console_handler
-                    print(f"\r{message}", end="", flush=True)
-            else:
-                self.logger.exception(message, *args, **kwargs)
+        self._emit("exception", message, args, append, stacklevel, kwargs)
 
     def _check_control_files(self) -> tuple:
         """Sprawdza obecność plików kontrolnych i zwraca odpowiedni tryb logowania."""
-        script_dir = os.path.dirname(os.path.abspath(__file__))
+        script_dir = Logger._SCRIPT_DIR
 
         # Definicja plików kontrolnych w kolejności priorytetów
         control_files = [
@@ -643,10 +827,16 @@ class Logger:
         initial_mode = Logger.DEFAULT_LOG_MODE
         file_logging_enabled = False
 
+        # Jeden odczyt katalogu zamiast os.path.exists dla każdego pliku
+        try:
+            with os.scandir(script_dir) as entries:
+                existing = {entry.name for entry in entries}
+        except OSError:
+            existing = set()
+
         # Sprawdzanie plików kontrolnych
         for filename, mode, logging_enabled in control_files:
-            filepath = os.path.join(script_dir, filename)
-            if os.path.exists(filepath):
+            if filename in existing:
                 # Znaleziono plik kontrolny
                 return mode, logging_enabled
 
@@ -654,6 +844,37 @@ class Logger:
         return initial_mode, file_logging_enabled
 
 
+class _FixedLayoutFormatter(logging.Formatter):
+    """
+    Formatter dla stałego układu konsoli bez czasu (LAYOUT) - składa linię
+    bezpośrednio zamiast formatowania % przy każdym rekordzie. Obsługa
+    wyjątków i stack_info jak w logging.Formatter.
+    """
+
+    # Układ rozpoznawany w formatach konsoli; grupa 1 - znak na początku
+    LAYOUT = re.compile(
+        r"(\S+) %\(levelname\)-7s: %\(filename\)s:%\(lineno\)d → %\(message\)s"
+    )
+
+    def __init__(self, fmt: str, prefix: str, datefmt=None) -> None:
+        super().__init__(fmt=fmt, datefmt=datefmt)
+        self._prefix = f"{prefix} "
+
+    def formatMessage(self, record):
+        return (
+            f"{self._prefix}{record.levelname:<7}: "
+            f"{record.filename}:{record.lineno} → {record.message}"
+        )
+
+
+def _make_formatter(fmt: str, datefmt=None) -> logging.Formatter:
+    """Zwraca szybki formatter dla stałego układu konsoli, w innym razie zwykły."""
+    match = _FixedLayoutFormatter.LAYOUT.fullmatch(fmt)
+    if match is not None:
+        return _FixedLayoutFormatter(fmt, match.group(1), datefmt=datefmt)
+    return logging.Formatter(fmt=fmt, datefmt=datefmt)
+
+
 # Niestandardowy formatter, który używa różnych formatów dla różnych poziomów logowania
 class LevelSpecificFormatter(logging.Formatter):
     def __init__(
@@ -670,34 +891,82 @@ class LevelSpecificFormatter(logging.Formatter):
 
         # Upewnij się, że wszystkie formaty są prawidłowo ustawione
         if info_fmt:
-            self.formatters[logging.INFO] = logging.Formatter(
-                fmt=info_fmt, datefmt=datefmt
-            )
+            self.formatters[logging.INFO] = _make_formatter(info_fmt, datefmt)
         if debug_fmt:
-            self.formatters[logging.DEBUG] = logging.Formatter(
-                fmt=debug_fmt, datefmt=datefmt
-            )
+            self.formatters[logging.DEBUG] = _make_formatter(debug_fmt, datefmt)
         if warning_fmt:
-            self.formatters[logging.WARNING] = logging.Formatter(
-                fmt=warning_fmt, datefmt=datefmt
-            )
+            self.formatters[logging.WARNING] = _make_formatter(warning_fmt, datefmt)
         if error_fmt:
-            self.formatters[logging.ERROR] = logging.Formatter(
-                fmt=error_fmt, datefmt=datefmt
-            )
+            self.formatters[logging.ERROR] = _make_formatter(error_fmt, datefmt)
         if critical_fmt:
-            self.formatters[logging.CRITICAL] = logging.Formatter(
-                fmt=critical_fmt, datefmt=datefmt
-            )
+            self.formatters[logging.CRITICAL] = _make_formatter(critical_fmt, datefmt)
 
         # Format domyślny dla poziomów, które nie mają zdefiniowanego formatu
         self.default_formatter = logging.Formatter(
             fmt=info_fmt or "%(message)s", datefmt=datefmt
         )
 
+        # Metody format pobrane raz - format() to jedno wyszukanie w słowniku
+        self._format_funcs = {
+            level: formatter.format for level, formatter in self.formatters.items()
+        }
+        self._default_format = self.default_formatter.format
+
     def format(self, record):
-        formatter = self.formatters.get(record.levelno, self.default_formatter)
-        return formatter.format(record)
+        return self._format_funcs.get(record.levelno, self._default_format)(record)
+
+
+class BufferedTimedRotatingFileHandler(logging.handlers.TimedRotatingFileHandler):
+    """
+    TimedRotatingFileHandler, który nie opróżnia bufora pliku po każdym rekordzie.
+
+    Bufor jest zapisywany na dysk co `capacity` rekordów, od razu dla rekordów
+    o poziomie `flush_level` lub wyższym oraz przy rotacji i zamknięciu.
+    Przed czasem rotacji (północ) decyzja o rotacji nie sięga do systemu plików.
+    """
+
+    def __init__(
+        self, *args, capacity=1024, flush_level=logging.ERROR, **kwargs
+    ) -> None:
+        self.capacity = capacity
+        self.flush_level = flush_level
+        self._pending = 0
+        self._in_emit = False
+        super().__init__(*args, **kwargs)
+
+    def _open(self):
+        return open(
+            self.baseFilename,
+            self.mode,
+            buffering=Logger.FILE_BUFFER_SIZE,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+
+    def shouldRollover(self, record):
+        # Najpierw samo porównanie czasu - biblioteka standardowa (od 3.11)
+        # sprawdza plik (os.path.exists/isfile) przy każdym rekordzie
+        if int(time.time()) < self.rolloverAt:
+            return False
+        return super().shouldRollover(record)
+
+    def emit(self, record):
+        # StreamHandler.emit wywołuje flush() po każdym rekordzie - pomijamy go
+        self._in_emit = True
+        try:
+            super().emit(record)
+        finally:
+            self._in_emit = False
+
+        self._pending += 1
+        if record.levelno >= self.flush_level or self._pending >= self.capacity:
+            self.flush()
+
+    def flush(self):
+        if self._in_emit:
+            return
+        self._pending = 0
+        super().flush()
 
 
 # Eksport klasy Logger
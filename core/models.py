@@ -1,100 +1,290 @@
 import datetime
 import os
 import random
-from typing import List, Optional
+from itertools import compress
+from operator import attrgetter
+from typing import Iterable, List, NamedTuple, Optional
 
 from core.logger import Logger
 
 logger = Logger()
 
+# Alfabet losowych ciągów znaków (a-z)
+_CHARACTERS = "abcdefghijklmnopqrstuvwxyz"
+
+# Przedziały długości losowych ciągów jednego obiektu:
+# texturePath, otherData, a5-a11
+_RANDOM_STRING_BOUNDS = ((5, 10), (5, 20)) + ((3, 7),) * 7
+
+# Możliwe długości każdego z ciągów (tablice dla random.choices)
+_RANDOM_STRING_LENGTHS = tuple(range(lo, hi + 1) for lo, hi in _RANDOM_STRING_BOUNDS)
+
+
+def _generate_random_strings(count: int) -> List[str]:
+    """
+    Generuje losowe ciągi znaków dla `count` obiektów - po jednym
+    na przedział z _RANDOM_STRING_BOUNDS, kolejno dla każdego obiektu.
+
+    Długości są losowane jednym wywołaniem random.choices na pole,
+    wszystkie znaki jednym wywołaniem, a wynik jest dzielony na ciągi.
+    """
+    choices = random.choices
+    columns = [choices(lengths, k=count) for lengths in _RANDOM_STRING_LENGTHS]
+    lengths = [length for row in zip(*columns) for length in row]
+    chars = "".join(random.choices(_CHARACTERS, k=sum(lengths)))
+    strings = []
+    pos = 0
+    for length in lengths:
+        strings.append(chars[pos : pos + length])
+        pos += length
+    return strings
+
+
+# Wartości losowanych metadanych tekstury
+_WIDTHS = range(1000, 8001)
+_HEIGHTS = range(500, 4001)
+_BIT_DEPTHS = (8, 16, 24, 32)
+_COLOR_PROFILES = ("sRGB", "Adobe RGB", "ProPhoto RGB", "lin_srgb", "scene_linear")
+_SIZES_MB_CENTI = range(100, 50001)  # 1.00 - 500.00 MB w setnych częściach
+_ALPHA = (True, False)
+_FLAGS = ("oryginał", "duplikat", "możliwy duplikat", "")
+_DAYS_AGO = range(1, 2001)
+_FILE_SIZES = range(1, 99)
+
+
+def _random_metadata(count: int) -> List[tuple]:
+    """
+    Losuje metadane `count` obiektów - każda kolumna jednym wywołaniem
+    random.choices.
+
+    Zwraca krotki (szerokosc, wysokosc, glebia_bitowa, profil_koloru,
+    rozmiar_mb, kanal_alpha, flaga, data_utworzenia, data_modyfikacji,
+    hash_sha256, filesize).
+    """
+    choices = random.choices
+
+    # Daty utworzenia i modyfikacji - strftime tylko raz dla całej partii
+    now = datetime.datetime.now()
+    now_str = now.strftime("%Y-%m-%d %H:%M:%S")
+    time_part = now_str[10:]
+    today = now.toordinal()
+    fromordinal = datetime.date.fromordinal
+
+    # Data modyfikacji (losowo w przeszłości)
+    modification_dates = [
+        fromordinal(today - days_ago).isoformat() + time_part
+        for days_ago in choices(_DAYS_AGO, k=count)
+    ]
+
+    # Hash SHA-256 - 32 losowe bajty na obiekt, jedno randbytes na partię
+    hex_digits = random.randbytes(32 * count).hex()
+    hashes = [hex_digits[pos : pos + 64] for pos in range(0, 64 * count, 64)]
+
+    return list(
+        zip(
+            choices(_WIDTHS, k=count),
+            choices(_HEIGHTS, k=count),
+            choices(_BIT_DEPTHS, k=count),
+            choices(_COLOR_PROFILES, k=count),
+            [centi / 100 for centi in choices(_SIZES_MB_CENTI, k=count)],
+            choices(_ALPHA, k=count),
+            choices(_FLAGS, k=count),
+            [now_str] * count,
+            modification_dates,
+            hashes,
+            choices(_FILE_SIZES, k=count),
+        )
+    )
+
+
+# Wartości neutralne dla TextureObject.from_dict - w kolejności
+# _RANDOM_STRING_BOUNDS i krotek _random_metadata
+_EMPTY_STRINGS = ("",) * len(_RANDOM_STRING_BOUNDS)
+_EMPTY_METADATA = (0, 0, 0, "", 0, False, "", "", "", "", 0)
+
+
+# Kategoria (kolumna A5) według rozszerzenia pliku bez kropki
+_EXT_CATEGORY = {
+    "exr": "HDR",
+    "hdr": "HDR",
+    "tx": "TX",
+    "jpg": "Obraz",
+    "jpeg": "Obraz",
+    "png": "Obraz",
+    "tif": "Obraz",
+    "tiff": "Obraz",
+}
+
+# Rozszerzenia obrazów, dla których kwadratowy plik to "Tekstura"
+_SQUARE_TEXTURE_EXTS = frozenset(("jpg", "jpeg", "png", "tif", "tiff"))
+
+# Status (kolumna A8) na podstawie flagi
+_STATUS_MAP = {
+    "oryginał": "Oryginalny",
+    "duplikat": "Duplikat",
+    "możliwy duplikat": "Możliwy duplikat",
+}
+
+
+def _extension(name: str) -> str:
+    """
+    Zwraca rozszerzenie nazwy pliku bez kropki, małymi literami, lub "".
+
+    Odpowiednik os.path.splitext(name)[1][1:].lower() dla samej nazwy
+    pliku: kropki na początku nazwy nie tworzą rozszerzenia.
+    """
+    dot = name.rfind(".")
+    if dot <= 0 or (name[0] == "." and not name[:dot].lstrip(".")):
+        return ""
+    return name[dot + 1 :].lower()
+
+
+# Domyślne rozszerzenia plików ładowanych przez load_textures_from_directory
+_DEFAULT_TEXTURE_EXTENSIONS = frozenset((".jpg", ".png", ".tif", ".tga"))
+
+# Liczba obiektów TextureObject utworzonych od ostatniego load_random_textures
+_created_count = 0
+
+
+def _category(ext: str, width, height) -> str:
+    """Zwraca kategorię tekstury (kolumna A5) dla rozszerzenia i wymiarów."""
+    if ext in _SQUARE_TEXTURE_EXTS and width == height:
+        return "Tekstura"
+    return _EXT_CATEGORY.get(ext, "Inny")
+
 
 class TextureObject:
     """Reprezentuje obiekt tekstury z metadanymi."""
 
+    # Stały zestaw atrybutów zamiast __dict__ w każdej instancji
+    __slots__ = (
+        "texturePath",
+        "otherData",
+        "longfilename",
+        "_selected",
+        "filesize",
+        "nazwa",
+        "szerokosc",
+        "wysokosc",
+        "glebia_bitowa",
+        "profil_koloru",
+        "rozmiar_mb",
+        "kanal_alpha",
+        "flaga",
+        "data_utworzenia",
+        "data_modyfikacji",
+        "hash_sha256",
+        "a5",
+        "a6",
+        "a7",
+        "a8",
+        "a9",
+        "a10",
+        "a11",
+        "_attr_cache",  # Bufor sformatowanych wartości kolumn (TextureListView)
+    )
+
     def __init__(self, texture_path="", other_data="", file_size=0, is_selected=False):
-        try:
-            self.texturePath = texture_path or self._generate_random_string(5, 10)
-            self.otherData = other_data or self._generate_random_string(5, 20)
-            self.longfilename = "-"
-            self._selected = is_selected
-            self.filesize = file_size or self._generate_random_number()
-
-            # Ekstrakcja nazwy pliku ze ścieżki
-            self.nazwa = os.path.basename(self.texturePath)
-
-            # Właściwości dla procesowania tekstur
-            self.szerokosc = random.randint(1000, 8000)
-            self.wysokosc = random.randint(500, 4000)
-            self.glebia_bitowa = random.choice([8, 16, 24, 32])
-            self.profil_koloru = random.choice(
-                ["sRGB", "Adobe RGB", "ProPhoto RGB", "lin_srgb", "scene_linear"]
-            )
-            self.rozmiar_mb = round(random.uniform(1.0, 500.0), 2)
-            self.kanal_alpha = random.choice([True, False])
-            self.flaga = random.choice(["oryginał", "duplikat", "możliwy duplikat", ""])
-
-            # Daty utworzenia i modyfikacji
-            now = datetime.datetime.now()
-            self.data_utworzenia = now.strftime("%Y-%m-%d %H:%M:%S")
-
-            # Data modyfikacji (losowo w przeszłości)
-            days_ago = random.randint(1, 2000)
-            modification_date = now - datetime.timedelta(days=days_ago)
-            self.data_modyfikacji = modification_date.strftime("%Y-%m-%d %H:%M:%S")
-
-            # Hash SHA-256
-            self.hash_sha256 = "".join(
-                random.choice("0123456789abcdef") for _ in range(64)
+        global _created_count
+        strings = _generate_random_strings(1)
+        meta = _random_metadata(1)[0]
+        self._init_fields(
+            texture_path, other_data, file_size, is_selected, strings, meta
+        )
+        _created_count += 1
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "TextureObject":
+        """
+        Tworzy obiekt z gotowych danych (klucze to nazwy atrybutów)
+        bez losowania wartości w __init__ - atrybuty spoza danych dostają
+        wartości neutralne.
+        """
+        texture = cls.__new__(cls)
+        rozmiar_mb = data.get("rozmiar_mb", 0)
+        texture._init_fields(
+            data.get("nazwa", ""),
+            "",
+            int(rozmiar_mb * 1024 * 1024) if rozmiar_mb else 0,
+            False,
+            _EMPTY_STRINGS,
+            _EMPTY_METADATA,
+        )
+        for key, value in data.items():
+            setattr(texture, key, value)
+        return texture
+
+    @classmethod
+    def create_many(cls, count: int) -> List["TextureObject"]:
+        """
+        Tworzy `count` losowych obiektów, losując ciągi znaków
+        i metadane dla całej partii naraz.
+        """
+        global _created_count
+        width = len(_RANDOM_STRING_BOUNDS)
+        strings = _generate_random_strings(count)
+        textures = []
+        for pos, meta in zip(range(0, count * width, width), _random_metadata(count)):
+            texture = cls.__new__(cls)
+            texture._init_fields("", "", 0, False, strings[pos : pos + width], meta)
+            textures.append(texture)
+        _created_count += count
+        return textures
+
+    def _init_fields(
+        self, texture_path, other_data, file_size, is_selected, strings, meta
+    ):
+        """
+        Ustawia atrybuty obiektu; `strings` to losowe ciągi w kolejności
+        _RANDOM_STRING_BOUNDS, `meta` to krotka z _random_metadata.
+        """
+        self.texturePath = texture_path or strings[0]
+        self.otherData = other_data or strings[1]
+        self.longfilename = "-"
+        self._selected = is_selected
+
+        # Ekstrakcja nazwy pliku ze ścieżki
+        self.nazwa = os.path.basename(self.texturePath)
+
+        # Właściwości dla procesowania tekstur
+        (
+            self.szerokosc,
+            self.wysokosc,
+            self.glebia_bitowa,
+            self.profil_koloru,
+            self.rozmiar_mb,
+            self.kanal_alpha,
+            self.flaga,
+            self.data_utworzenia,
+            self.data_modyfikacji,
+            self.hash_sha256,
+            random_size,
+        ) = meta
+        self.filesize = file_size or random_size
+
+        # Dodajemy przykładowe dane z zainicjowanego obiektu
+        if self.nazwa == "06-09_Sunset_B.hdr":
+            self.szerokosc = 15000
+            self.wysokosc = 7500
+            self.glebia_bitowa = 32
+            self.profil_koloru = "lin_srgb"
+            self.rozmiar_mb = 312.42
+            self.kanal_alpha = False
+            self.flaga = "oryginał"
+            self.data_utworzenia = "2025-04-06 18:35:44"
+            self.data_modyfikacji = "2019-07-14 20:05:10"
+            self.hash_sha256 = (
+                "ac10686245b34977ff48850b75b48553efd9d20dad9ed342e713ebeb7f792ebc"
             )
 
-            # Dodajemy przykładowe dane z zainicjowanego obiektu
-            if self.nazwa == "06-09_Sunset_B.hdr":
-                self.szerokosc = 15000
-                self.wysokosc = 7500
-                self.glebia_bitowa = 32
-                self.profil_koloru = "lin_srgb"
-                self.rozmiar_mb = 312.42
-                self.kanal_alpha = False
-                self.flaga = "oryginał"
-                self.data_utworzenia = "2025-04-06 18:35:44"
-                self.data_modyfikacji = "2019-07-14 20:05:10"
-                self.hash_sha256 = (
-                    "ac10686245b34977ff48850b75b48553efd9d20dad9ed342e713ebeb7f792ebc"
-                )
-
-            # Dodajemy nowe właściwości dla kolumn A5-A11
-            self.a5 = self._generate_random_string(3, 7)
-            self.a6 = self._generate_random_string(3, 7)
-            self.a7 = self._generate_random_string(3, 7)
-            self.a8 = self._generate_random_string(3, 7)
-            self.a9 = self._generate_random_string(3, 7)
-            self.a10 = self._generate_random_string(3, 7)
-            self.a11 = self._generate_random_string(3, 7)
-
-            if not hasattr(TextureObject, "_count"):
-                TextureObject._count = 0
-            TextureObject._count += 1
-        except Exception as e:
-            logger.error(f"Błąd podczas tworzenia TextureObject: {str(e)}")
-            raise
+        # Dodajemy nowe właściwości dla kolumn A5-A11
+        (self.a5, self.a6, self.a7, self.a8, self.a9, self.a10, self.a11) = strings[2:]
 
     @classmethod
     def log_creation_count(cls):
         """Loguje liczbę utworzonych elementów."""
-        if hasattr(cls, "_count") and cls._count > 0:
-            logger.debug(f"Utworzono {cls._count} elementów TextureObject")
-
-    @staticmethod
-    def _generate_random_string(min_length: int, max_length: int) -> str:
-        """Generuje losowy ciąg znaków o określonej długości."""
-        CHARACTERS = tuple(chr(n) for n in range(97, 122))
-        length = random.randint(min_length, max_length)
-        return "".join(random.choice(CHARACTERS) for _ in range(length))
-
-    @staticmethod
-    def _generate_random_number() -> int:
-        """Generuje losową liczbę dla rozmiaru pliku."""
-        return random.randrange(1, 99)
+        if _created_count > 0:
+            logger.debug(f"Utworzono {_created_count} elementów TextureObject")
 
     @property
     def is_selected(self) -> bool:
@@ -113,6 +303,20 @@ class TextureObject:
         return self.texturePath
 
 
+# Odczyt stanu zaznaczenia i rozmiaru bez wywołań property (map() w C)
+_get_selected = attrgetter("_selected")
+_get_filesize = attrgetter("filesize")
+
+
+class SelectionSnapshot(NamedTuple):
+    """Stan zaznaczenia kolekcji tekstur wyznaczony jednym przejściem."""
+
+    total: int
+    selected: int
+    size_sum: int
+    all_selected: bool
+
+
 class TextureManager:
     """Zarządza kolekcją obiektów tekstur."""
 
@@ -121,31 +325,38 @@ class TextureManager:
 
     def load_random_textures(self, count: int = 10) -> None:
         """Ładuje określoną liczbę losowych tekstur do testów."""
-        if hasattr(TextureObject, "_count"):
-            delattr(TextureObject, "_count")
-        if hasattr(TextureObject, "_is_first_log"):
-            delattr(TextureObject, "_is_first_log")
-        self._textures = [TextureObject() for _ in range(count)]
+        global _created_count
+        _created_count = 0
+        try:
+            self._textures = TextureObject.create_many(count)
+        except Exception as e:
+            logger.error(f"Błąd podczas tworzenia losowych tekstur: {str(e)}")
+            self._textures = []
+            return
         TextureObject.log_creation_count()
 
     def load_textures_from_directory(
-        self, directory: str, extensions: List[str] = [".jpg", ".png", ".tif", ".tga"]
+        self, directory: str, extensions: Iterable[str] = _DEFAULT_TEXTURE_EXTENSIONS
     ) -> None:
         """Ładuje tekstury z podanego katalogu z określonymi rozszerzeniami."""
-        if not os.path.exists(directory) or not os.path.isdir(directory):
+        if not os.path.isdir(directory):
             logger.error(f"Katalog nie istnieje: {directory}")
             return
 
+        wanted = frozenset(extensions)
         self._textures = []
         try:
-            for filename in os.listdir(directory):
-                if os.path.splitext(filename)[1].lower() in extensions:
-                    file_path = os.path.join(directory, filename)
-                    file_size = os.path.getsize(file_path)
+            # Jedno przejście scandir - typ i rozmiar pliku z DirEntry
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    filename = entry.name
+                    ext = _extension(filename)
+                    if not ext or "." + ext not in wanted or not entry.is_file():
+                        continue
                     texture_obj = TextureObject(
-                        texture_path=file_path,  # Używamy pełnej ścieżki
-                        other_data=os.path.splitext(filename)[0],
-                        file_size=file_size,
+                        texture_path=entry.path,  # Używamy pełnej ścieżki
+                        other_data=filename[: -len(ext) - 1],
+                        file_size=entry.stat().st_size,
                     )
                     texture_obj.nazwa = filename  # Ustawiamy właściwą nazwę pliku
                     self._textures.append(texture_obj)
@@ -176,25 +387,37 @@ class TextureManager:
     def select_all(self) -> None:
         """Zaznacza wszystkie tekstury."""
         for texture in self._textures:
-            texture.select()
+            texture._selected = True
 
     def deselect_all(self) -> None:
         """Odznacza wszystkie tekstury."""
         for texture in self._textures:
-            texture.deselect()
+            texture._selected = False
 
     def are_all_selected(self) -> bool:
         """Sprawdza, czy wszystkie tekstury są zaznaczone."""
-        return all(texture.is_selected for texture in self._textures)
+        return all(map(_get_selected, self._textures))
 
     def count_selected(self) -> int:
         """Zlicza liczbę zaznaczonych tekstur."""
-        return sum(1 for texture in self._textures if texture.is_selected)
+        return sum(map(_get_selected, self._textures))
 
     def calculate_selected_size(self) -> int:
         """Oblicza łączny rozmiar zaznaczonych tekstur."""
+        textures = self._textures
         return sum(
-            texture.filesize for texture in self._textures if texture.is_selected
+            compress(map(_get_filesize, textures), map(_get_selected, textures))
+        )
+
+    def snapshot(self) -> SelectionSnapshot:
+        """Zwraca liczbę tekstur, zaznaczonych i ich rozmiar w jednym przejściu."""
+        textures = self._textures
+        flags = list(map(_get_selected, textures))
+        selected = sum(flags)
+        size_sum = sum(compress(map(_get_filesize, textures), flags))
+        total = len(textures)
+        return SelectionSnapshot(
+            total, selected, size_sum, total > 0 and selected == total
         )
 
     def load_sample_textures(self):
@@ -254,17 +477,6 @@ class TextureManager:
             },
         ]
 
-        # Słownik do mapowania kategorii na podstawie rozszerzenia
-        category_map = {
-            "exr": "HDR",
-            "hdr": "HDR",
-            "jpg": "Obraz",
-            "jpeg": "Obraz",
-            "png": "Obraz",
-            "tif": "Obraz",
-            "tiff": "Obraz",
-        }
-
         # Dla każdego przykładu dodajemy nowe pola
         for data in example_data:
             # Szerokość i wysokość są już dostępne, tworzymy "rozdzielczość"
@@ -272,40 +484,15 @@ class TextureManager:
                 data["a7"] = f"{data['szerokosc']}x{data['wysokosc']}"
 
             # Format pliku na podstawie nazwy
-            if "nazwa" in data:
-                ext = os.path.splitext(data["nazwa"])[1].lower()
-                data["a6"] = ext[1:] if ext else ""
+            ext = _extension(data.get("nazwa", ""))
+            data["a6"] = ext
 
             # Kategoria na podstawie rozszerzenia lub rozmiaru
-            ext_key = data["a6"] if "a6" in data else ""
-            if ext_key in category_map:
-                if (
-                    "szerokosc" in data
-                    and "wysokosc" in data
-                    and data["szerokosc"] == data["wysokosc"]
-                    and ext_key in ["jpg", "jpeg", "png", "tif", "tiff"]
-                ):
-                    data["a5"] = "Tekstura"
-                else:
-                    data["a5"] = category_map[ext_key]
-            else:
-                data["a5"] = "Inny"
-
-            # Status na podstawie flagi
-            if "flaga" in data:
-                flaga = data["flaga"]
-                if flaga == "oryginał":
-                    data["a8"] = "Oryginalny"
-                elif flaga == "duplikat":
-                    data["a8"] = "Duplikat"
-                elif flaga == "możliwy duplikat":
-                    data["a8"] = "Możliwy duplikat"
-                elif flaga:
-                    data["a8"] = flaga
-                else:
-                    data["a8"] = "Nowy"
-            else:
-                data["a8"] = "Nowy"
+            data["a5"] = _category(ext, data.get("szerokosc"), data.get("wysokosc"))
+
+            # Status na podstawie flagi (nieznana flaga przechodzi bez zmian)
+            flaga = data.get("flaga", "")
+            data["a8"] = _STATUS_MAP.get(flaga) or flaga or "Nowy"
 
             # Przykładowe wartości dla pozostałych pól
             data["a9"] = "Sprawdź"
@@ -314,11 +501,7 @@ class TextureManager:
 
         # Tworzenie obiektów TextureObject z przykładowych danych
         self._textures = []
-        for data in example_data:
-            texture = TextureObject()
-            for key, value in data.items():
-                setattr(texture, key, value)
-            self._textures.append(texture)
+        self._textures = [TextureObject.from_dict(data) for data in example_data]
 
         # logger.debug(f"Załadowano {len(self._textures)} przykładowych tekstur")
 
@@ -364,6 +547,8 @@ class TextureManager:
 class TextureFromAnalysis(TextureObject):
     """Reprezentuje obiekt tekstury utworzony z danych z analizy."""
 
+    __slots__ = ("ścieżka",)
+
     def __init__(self, texture_data=None):
         """
         Inicjalizacja obiektu tekstury z danych z analizy.
@@ -395,23 +580,13 @@ class TextureFromAnalysis(TextureObject):
 
             # Dodatkowe atrybuty dla kolumn A5-A11
             # Te wartości moglibyśmy też wygenerować bazując na innych polach
-            rozszerzenie = os.path.splitext(self.nazwa)[1].lower() if self.nazwa else ""
+            rozszerzenie = _extension(self.nazwa) if self.nazwa else ""
 
             # A5 - Kategoria
-            if rozszerzenie in [".exr", ".hdr"]:
-                self.a5 = "HDR"
-            elif rozszerzenie in [".tx"]:
-                self.a5 = "TX"
-            elif rozszerzenie in [".jpg", ".jpeg", ".png", ".tif", ".tiff"]:
-                if self.szerokosc == self.wysokosc:
-                    self.a5 = "Tekstura"
-                else:
-                    self.a5 = "Obraz"
-            else:
-                self.a5 = "Inny"
+            self.a5 = _category(rozszerzenie, self.szerokosc, self.wysokosc)
 
             # A6 - Format (rozszerzenie bez kropki)
-            self.a6 = rozszerzenie[1:] if rozszerzenie else ""
+            self.a6 = rozszerzenie
 
             # A7 - Rozdzielczość
             self.a7 = (
@@ -421,14 +596,7 @@ class TextureFromAnalysis(TextureObject):
             )
 
             # A8 - Status bazujący na fladze
-            if self.flaga == "oryginał":
-                self.a8 = "Oryginalny"
-            elif self.flaga == "duplikat":
-                self.a8 = "Duplikat"
-            elif self.flaga == "możliwy duplikat":
-                self.a8 = "Możliwy duplikat"
-            else:
-                self.a8 = "Nowy"
+            self.a8 = _STATUS_MAP.get(self.flaga, "Nowy")
 
             # Pozostałe pola wypełniane przykładowymi wartościami
             self.a9 = "Sprawdź"
@@ -199,6 +199,8 @@ class TextureProcessor:
         """
         self.ścieżka_oiiotool = ścieżka_oiiotool
         self._callback_statusu = None
+        # Wyniki stat() zebrane podczas wyszukiwania plików: ścieżka -> stat
+        self._statystyki_plików: Dict[str, os.stat_result] = {}
         self.oiiotool_dostępny = self._sprawdz_oiiotool()
 
     def _sprawdz_oiiotool(self) -> bool:
@@ -385,19 +387,38 @@ class TextureProcessor:
 
             return kategoria, str(ścieżka_pliku)
 
-        # Zbieranie plików
+        # Zbieranie plików jednym przejściem os.scandir - wynik stat()
+        # zapamiętujemy dla etapu metadanych, żeby nie odpytywać dysku ponownie
         pliki_do_przetworzenia = []
+        statystyki = self._statystyki_plików
+        statystyki.clear()
 
-        if przeszukuj_podfoldery:
-            for root, _, files in os.walk(ścieżka_folderu):
-                for file in files:
-                    pliki_do_przetworzenia.append(os.path.join(root, file))
-        else:
-            pliki_do_przetworzenia = [
-                os.path.join(ścieżka_folderu, f)
-                for f in os.listdir(ścieżka_folderu)
-                if os.path.isfile(os.path.join(ścieżka_folderu, f))
-            ]
+        foldery = [ścieżka_folderu]
+        while foldery:
+            folder = foldery.pop()
+            try:
+                wpisy = os.scandir(folder)
+            except OSError:
+                # Jak os.walk: nieczytelny lub usunięty podfolder jest pomijany,
+                # błąd dotyczy tylko folderu głównego
+                if folder is ścieżka_folderu:
+                    raise
+                continue
+            with wpisy:
+                for wpis in wpisy:
+                    if wpis.is_dir():
+                        # Jak os.walk: bez wchodzenia w dowiązania do folderów
+                        if przeszukuj_podfoldery and not wpis.is_symlink():
+                            foldery.append(wpis.path)
+                        continue
+                    if not przeszukuj_podfoldery and not wpis.is_file():
+                        continue
+
+                    pliki_do_przetworzenia.append(wpis.path)
+                    try:
+                        statystyki[wpis.path] = wpis.stat()
+                    except OSError:
+                        pass
 
         total_files = len(pliki_do_przetworzenia)
 
@@ -443,11 +464,12 @@ class TextureProcessor:
                 wszystkie_pliki.append((ścieżka, rozszerzenie))
 
         total_files = len(wszystkie_pliki)
+        statystyki = self._statystyki_plików
 
         def utwórz_metadane_pliku(args):
             ścieżka, rozszerzenie = args
             try:
-                statinfo = os.stat(ścieżka)
+                statinfo = statystyki.get(ścieżka) or os.stat(ścieżka)
                 rozmiar_mb = round(statinfo.st_size / (1024 * 1024), 2)
 
                 # Pobieranie czasów utworzenia i modyfikacji
@@ -485,6 +507,7 @@ class TextureProcessor:
                         f"Przetworzono podstawowe metadane dla {i+1} z {total_files} plików...",
                     )
 
+        statystyki.clear()
         return metadane
 
     def _oznacz_możliwe_duplikaty(
@@ -8,9 +8,12 @@ Dostosowany do działania w środowisku Cinema 4D.
 
 import argparse
 import datetime
+import hashlib
 import json
 import os
 import sys
+import tempfile
+from typing import NamedTuple, Optional
 
 # Dodawanie ścieżki projektu do sys.path
 KATALOG_PROGRAMU = os.path.dirname(os.path.abspath(__file__))
@@ -34,6 +37,26 @@ except ImportError as e:
     raise
 
 
+class AnalyzeResult(NamedTuple):
+    """
+    Wynik analizy folderu tekstur zwracany przez analizuj_folder_tekstur.
+
+    Pola:
+        sukces: Czy analiza zakończyła się powodzeniem
+        komunikat: Opis błędu (pusty przy powodzeniu)
+        sciezka_raportu: Ścieżka do zapisanego pliku statystyk
+        liczba_plikow_graficznych: Liczba plików graficznych lub None,
+                                   jeśli brak statystyk
+        dane: Pełne wyniki TextureWorker (pliki, statystyki, konfiguracja)
+    """
+
+    sukces: bool
+    komunikat: str = ""
+    sciezka_raportu: str = ""
+    liczba_plikow_graficznych: Optional[int] = None
+    dane: Optional[dict] = None
+
+
 # Funkcja do ustalania folderu raportów
 def get_raport_folder():
     """
@@ -58,6 +81,108 @@ def get_raport_folder():
 ŚCIEŻKA_OIIOTOOL = os.path.join(KATALOG_PROGRAMU, "oiiotool", "oiiotool.exe")
 
 
+# Folder z zapisanymi wynikami analiz (poza folderem tekstur - zapis pliku
+# w analizowanym folderze zmieniałby jego mtime i unieważniał klucz)
+FOLDER_CACHE = os.path.join(KATALOG_PROJEKTU, "cache")
+
+# Wersja formatu pliku cache - zmiana unieważnia wszystkie zapisane wyniki
+CACHE_SCHEMA = 1
+
+# Wyniki analiz w bieżącej sesji: ścieżka folderu -> (klucz, wpis cache)
+_cache_w_pamięci = {}
+
+
+def _klucz_folderu(ścieżka_folderu):
+    """
+    Wyznacza klucz ważności cache dla folderu: mtime folderu oraz liczba,
+    łączny rozmiar i najnowszy mtime plików (jedno przejście os.scandir).
+    """
+    liczba = 0
+    rozmiar = 0
+    najnowszy = 0
+    with os.scandir(ścieżka_folderu) as wpisy:
+        for wpis in wpisy:
+            if not wpis.is_file():
+                continue
+            st = wpis.stat()
+            liczba += 1
+            rozmiar += st.st_size
+            najnowszy = max(najnowszy, st.st_mtime_ns)
+
+    return [os.stat(ścieżka_folderu).st_mtime_ns, liczba, rozmiar, najnowszy]
+
+
+def _plik_cache(ścieżka_folderu):
+    """Zwraca ścieżkę pliku cache dla danego folderu tekstur."""
+    skrót = hashlib.sha1(os.path.normcase(ścieżka_folderu).encode("utf-8"))
+    return os.path.join(FOLDER_CACHE, f"txm-{skrót.hexdigest()}.json")
+
+
+def _wczytaj_cache(ścieżka_folderu, klucz):
+    """
+    Zwraca zapisany wpis cache, jeśli jego klucz i schemat są aktualne.
+
+    Returns:
+        dict lub None: {"schema", "klucz", "sciezka_raportu", "dane"}
+    """
+    wpis = _cache_w_pamięci.get(ścieżka_folderu)
+    if wpis is not None and wpis["klucz"] == klucz:
+        return wpis
+
+    try:
+        with open(_plik_cache(ścieżka_folderu), "r", encoding="utf-8") as f:
+            wpis = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if wpis.get("schema") != CACHE_SCHEMA or wpis.get("klucz") != klucz:
+        return None
+
+    _cache_w_pamięci[ścieżka_folderu] = wpis
+    return wpis
+
+
+def _zapisz_cache(ścieżka_folderu, klucz, ścieżka_raportu, wyniki):
+    """
+    Zapisuje wyniki analizy atomowo (plik tymczasowy + os.replace).
+
+    W pamięci przechowywana jest kopia odczytana z zapisanego JSON - taka sama
+    jak po odczycie cache z dysku (np. krotki stają się listami) i niezależna
+    od wyników zwróconych wywołującemu. Wyniki, których nie da się zapisać
+    w JSON, nie trafiają do cache.
+    """
+    wpis = {
+        "schema": CACHE_SCHEMA,
+        "klucz": klucz,
+        "sciezka_raportu": ścieżka_raportu,
+        "dane": wyniki,
+    }
+
+    try:
+        zawartość = json.dumps(wpis, ensure_ascii=False)
+    except (TypeError, ValueError) as e:
+        logger.warning(f"Pominięto cache analizy - dane spoza JSON: {str(e)}")
+        return
+
+    _cache_w_pamięci[ścieżka_folderu] = json.loads(zawartość)
+
+    try:
+        os.makedirs(FOLDER_CACHE, exist_ok=True)
+        fd, ścieżka_tymczasowa = tempfile.mkstemp(
+            dir=FOLDER_CACHE, prefix=".txm-", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(zawartość)
+            os.replace(ścieżka_tymczasowa, _plik_cache(ścieżka_folderu))
+        except BaseException:
+            os.unlink(ścieżka_tymczasowa)
+            raise
+        logger.debug(f"Zapisano cache analizy: {_plik_cache(ścieżka_folderu)}")
+    except Exception as e:
+        logger.warning(f"Nie udało się zapisać cache analizy: {str(e)}")
+
+
 def aktualizacja_statusu(etap, postęp, wiadomość):
     """
     Wyświetla status przetwarzania.
@@ -83,15 +208,37 @@ def analizuj_folder_tekstur(
         callback_statusu: Opcjonalny callback do raportowania postępu
 
     Returns:
-        dict: Słownik z wynikami analizy lub informacją o błędzie
+        AnalyzeResult: Wynik analizy lub informacja o błędzie
     """
     # Sprawdź czy folder istnieje
     if not os.path.isdir(ścieżka_folderu):
         logger.error(f"Podany folder nie istnieje: {ścieżka_folderu}")
-        return {
-            "sukces": False,
-            "komunikat": f"Podany folder nie istnieje: {ścieżka_folderu}",
-        }
+        return AnalyzeResult(
+            False, komunikat=f"Podany folder nie istnieje: {ścieżka_folderu}"
+        )
+
+    # Niezmieniony folder - zwracamy wynik poprzedniej analizy
+    # (cache obejmuje tylko analizę bez podfolderów)
+    klucz = None
+    if not przeszukuj_podfoldery:
+        try:
+            klucz = _klucz_folderu(ścieżka_folderu)
+            wpis = _wczytaj_cache(ścieżka_folderu, klucz)
+        except OSError as e:
+            logger.warning(f"Nie można sprawdzić cache analizy: {str(e)}")
+            wpis = None
+
+        if wpis is not None:
+            logger.debug(f"Użyto zapisanej analizy folderu: {ścieżka_folderu}")
+            dane = wpis["dane"]
+            return AnalyzeResult(
+                True,
+                sciezka_raportu=wpis["sciezka_raportu"],
+                liczba_plikow_graficznych=dane.get("statystyki", {}).get(
+                    "liczba_plików_graficznych"
+                ),
+                dane=dane,
+            )
 
     # Ustalamy folder do zapisania raportu
     folder_raportów = get_raport_folder()
@@ -142,10 +289,9 @@ def analizuj_folder_tekstur(
 
     except Exception as e:
         logger.error(f"Błąd inicjalizacji TextureWorker: {str(e)}")
-        return {
-            "sukces": False,
-            "komunikat": f"Błąd inicjalizacji TextureWorker: {str(e)}",
-        }
+        return AnalyzeResult(
+            False, komunikat=f"Błąd inicjalizacji TextureWorker: {str(e)}"
+        )
 
     # Sprawdź czy oiiotool istnieje
     if os.path.isfile(ŚCIEŻKA_OIIOTOOL):
@@ -168,24 +314,36 @@ def analizuj_folder_tekstur(
             ścieżka_folderu, przeszukuj_podfoldery, None, ŚCIEŻKA_OIIOTOOL
         )
 
+        # Anulowana lub nieudana analiza - bez raportu i bez zapisu do cache
+        if wyniki.get("sukces") is False or "pliki" not in wyniki:
+            komunikat = wyniki.get("komunikat", "")
+            logger.debug(f"Przetwarzanie przerwane: {komunikat}")
+            return AnalyzeResult(False, komunikat=komunikat)
+
         # Zapisujemy tylko statystyki
+        liczba_plików = None
         if "statystyki" in wyniki:
             with open(ścieżka_wyjściowa, "w", encoding="utf-8") as f:
                 json.dump(wyniki["statystyki"], f, indent=4, ensure_ascii=False)
                 logger.debug(f"Zapisano statystyki do: {ścieżka_wyjściowa}")
-
-        # Dodaj pola informacyjne
-        wyniki["sukces"] = True
-        wyniki["ścieżka_statystyk"] = ścieżka_wyjściowa
+            liczba_plików = wyniki["statystyki"].get("liczba_plików_graficznych", 0)
 
         logger.debug("Przetwarzanie zakończone pomyślnie!")
         logger.debug(f"Statystyki zapisano do: {ścieżka_wyjściowa}")
 
-        return wyniki
+        if klucz is not None:
+            _zapisz_cache(ścieżka_folderu, klucz, ścieżka_wyjściowa, wyniki)
+
+        return AnalyzeResult(
+            True,
+            sciezka_raportu=ścieżka_wyjściowa,
+            liczba_plikow_graficznych=liczba_plików,
+            dane=wyniki,
+        )
 
     except Exception as e:
         logger.error(f"Błąd podczas przetwarzania tekstur: {str(e)}")
-        return {"sukces": False, "komunikat": f"Błąd podczas przetwarzania: {str(e)}"}
+        return AnalyzeResult(False, komunikat=f"Błąd podczas przetwarzania: {str(e)}")
 
 
 def main():
@@ -223,10 +381,10 @@ def main():
     # Analiza tekstur
     wyniki = analizuj_folder_tekstur(args.ścieżka_folderu, args.przeszukuj_podfoldery)
 
-    if wyniki.get("sukces", False):
+    if wyniki.sukces:
         return 0
     else:
-        logger.error(wyniki.get("komunikat", "Nieznany błąd"))
+        logger.error(wyniki.komunikat or "Nieznany błąd")
         return 1
 
 
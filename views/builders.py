@@ -43,7 +43,7 @@ class TreeViewBuilder:
         """Tworzy kontrolkę TreeView dla danych z analizy tekstur."""
         try:
             bc = c4d.BaseContainer()
-            for flag_name, flag_value in UIConstants.TREEVIEW_FLAGS.items():
+            for flag_name, flag_value in UIConstants.get_treeview_flags().items():
                 bc.SetBool(flag_value, True)
 
             treeview = self.dialog.AddCustomGui(
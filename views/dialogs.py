@@ -1,4 +1,5 @@
 import c4d
+import c4d.gui
 
 from core.constants import (
     GROUP_H_CENTER,
@@ -9,6 +10,7 @@ from core.constants import (
     SPACER_TOP,
     UIConstants,
 )
+from core.controller import invalidate
 from core.controllers import StatusManager, TextureController
 from core.logger import Logger
 from core.models import TextureManager
@@ -32,9 +34,7 @@ class AboutDialog(c4d.gui.GeDialog):
         self.GroupSpace(0, 0)
 
         self.AddStaticText(SPACER_TOP, c4d.BFV_SCALEFIT, name="")
-        self.AddStaticText(
-            0, c4d.BFH_CENTER, name=f"{UIConstants.APP_NAME} v{UIConstants.APP_VERSION}"
-        )
+        self.AddStaticText(0, c4d.BFH_CENTER, name=UIConstants.WINDOW_TITLE)
         self.AddStaticText(SPACER_TOP, c4d.BFV_SCALEFIT, name="")
 
         self.GroupBegin(GROUP_H_CENTER, c4d.BFH_SCALEFIT, cols=3, rows=1)
@@ -175,6 +175,13 @@ class Dlg(c4d.gui.GeDialog):
             logger.error(f"Błąd w InitValues: {str(e)}")
             return False
 
+    def DestroyWindow(self):
+        """Zwalnia pulę wątków kontrolera przy zamykaniu okna."""
+        try:
+            self.texture_controller.shutdown()
+        except Exception as e:
+            logger.error(f"Błąd w DestroyWindow: {str(e)}")
+
     def Command(self, id, msg):
         """Obsługuje zdarzenia w dialogu."""
         try:
@@ -205,6 +212,8 @@ class Dlg(c4d.gui.GeDialog):
             elif id == UIConstants.BTN_CLEAR:
                 return self.texture_controller.clear_textures()
             elif id == UIConstants.BTN_REFRESH:
+                # Odśwież dane o folderze tekstur przy następnym sprawdzeniu
+                invalidate()
                 self.treeview.Refresh()
                 return self.texture_controller.update_ui_state()
             elif id == UIConstants.PROGRESS_BTN:
@@ -238,16 +247,16 @@ class Dlg(c4d.gui.GeDialog):
         """Oblicza i aktualizuje informacje o zaznaczeniu."""
         try:
             if hasattr(self, "texture_controller"):
-                self.texture_controller.update_selection_info()
-                self.texture_controller.update_ui_state()  # Dodane - aktualizacja stanu przycisków
+                snap = self._texture_manager.snapshot()
+                self.texture_controller.update_selection_info(snap)
+                self.texture_controller.update_ui_state(snap)  # Dodane - aktualizacja stanu przycisków
 
                 # Aktualizacja głównego statusu
-                selected_count = self._texture_manager.count_selected()
-                total_count = self._texture_manager.get_texture_count()
-                selected_size = self._texture_manager.calculate_selected_size()
+                total_count, selected_count, selected_size, _ = snap
 
                 status_text = f"Zaznaczono {selected_count} z {total_count} plików ({format_file_size(selected_size)})"
-                self.SetString(UIConstants.STATUS_TOTAL_SIZE, f"Status: {status_text}")
+                # Przez kontroler - zapis czyści memo update_selection_info
+                self.texture_controller.set_status_text(f"Status: {status_text}")
 
                 return True
             return False
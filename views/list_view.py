@@ -2,6 +2,7 @@ import datetime  # Import przeniesiony na początek pliku
 from typing import Any, Dict, Optional
 
 import c4d
+import c4d.gui
 
 from core.constants import UIConstants
 from core.logger import Logger
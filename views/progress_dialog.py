@@ -1,4 +1,7 @@
+import threading
+
 import c4d
+import c4d.gui
 
 from core.constants import UIConstants
 from core.logger import Logger
@@ -39,7 +42,8 @@ class ProgressDialog(c4d.gui.GeDialog):
         self.action_button_text = action_button_text
         self.is_action_enabled = is_action_enabled
         self.progress = 0.0  # Wartość postępu 0.0-1.0
-        self.canceled = False
+        # Ustawiane przyciskiem Anuluj - odczytywane także przez wątki robocze
+        self.cancel_event = threading.Event()
         logger.debug(f"Inicjalizuję dialog postępu: {title}")
 
     def CreateLayout(self):
@@ -127,7 +131,7 @@ class ProgressDialog(c4d.gui.GeDialog):
         try:
             if id == self.ID_BTN_CANCEL:
                 logger.debug(f"Kliknięto przycisk Anuluj w dialogu '{self.title}'")
-                self.canceled = True
+                self.cancel_event.set()
                 self.Close()
                 return True
 
@@ -148,8 +152,8 @@ class ProgressDialog(c4d.gui.GeDialog):
         Przetwarza zdarzenia w kolejce C4D, aby odświeżyć interfejs.
         """
         try:
-            # Odświeżenie interfejsu i przetworzenie zdarzeń
-            c4d.DrawViews(c4d.DRAWFLAGS_FORCEFULLREDRAW)
+            # Kontrolki dialogu odświeżają się same po SetString/SendMessage -
+            # wystarczy pobudzić pętlę zdarzeń, bez przerysowania viewportów
             c4d.EventAdd()
             return True
         except Exception as e:
@@ -210,7 +214,7 @@ class ProgressDialog(c4d.gui.GeDialog):
         Returns:
             bool: True jeśli operacja została anulowana, False w przeciwnym razie
         """
-        return self.canceled
+        return self.cancel_event.is_set()
 
     def StopProgress(self):
         """Zatrzymuje animację paska postępu."""